@@ -0,0 +1,64 @@
+"""Add attendance_daily_summary pre-aggregation table.
+
+Revision ID: add_attendance_daily_summary
+Revises: add_oauth_support
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_attendance_daily_summary'
+down_revision: Union[str, None] = 'add_oauth_support'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    """Create attendance_daily_summary and backfill it from attendance_records."""
+    if not table_exists('attendance_daily_summary'):
+        op.create_table(
+            'attendance_daily_summary',
+            sa.Column('project_id', sa.BigInteger(), nullable=False),
+            sa.Column('attendance_date', sa.Date(), nullable=False),
+            sa.Column('class_name', sa.String(50), nullable=False),
+            sa.Column('section', sa.String(50), nullable=False, server_default=''),
+            sa.Column('total', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('present_count', sa.Integer(), nullable=False, server_default='0'),
+            sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('project_id', 'attendance_date', 'class_name', 'section'),
+        )
+
+    # Backfill from existing attendance (present rate counts late as present)
+    op.execute(sa.text("""
+        INSERT INTO attendance_daily_summary
+            (project_id, attendance_date, class_name, section, total, present_count)
+        SELECT
+            ar.project_id,
+            ar.attendance_date,
+            s.class_name,
+            COALESCE(s.section, ''),
+            COUNT(*),
+            COUNT(*) FILTER (WHERE ar.status IN ('PRESENT', 'LATE'))
+        FROM attendance_records ar
+        JOIN students s ON s.id = ar.student_id
+        GROUP BY ar.project_id, ar.attendance_date, s.class_name, COALESCE(s.section, '')
+        ON CONFLICT (project_id, attendance_date, class_name, section) DO UPDATE
+        SET total = EXCLUDED.total, present_count = EXCLUDED.present_count
+    """))
+
+
+def downgrade() -> None:
+    op.drop_table('attendance_daily_summary')
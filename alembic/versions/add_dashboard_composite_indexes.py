@@ -0,0 +1,61 @@
+"""Add composite indexes for dashboard queries.
+
+Revision ID: add_dashboard_indexes
+Revises: add_attendance_daily_summary
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_dashboard_indexes'
+down_revision: Union[str, None] = 'add_attendance_daily_summary'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return index_name in {ix['name'] for ix in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    if not index_exists('attendance_records', 'ix_attendance_proj_date'):
+        op.create_index(
+            'ix_attendance_proj_date',
+            'attendance_records',
+            ['project_id', 'attendance_date'],
+            postgresql_include=['status', 'student_id'],
+        )
+    if not index_exists('exam_records', 'ix_exam_proj_date'):
+        op.create_index(
+            'ix_exam_proj_date',
+            'exam_records',
+            ['project_id', 'exam_date', 'created_at'],
+            postgresql_include=['exam_name', 'subject'],
+        )
+    if not index_exists('tasks', 'ix_task_proj_status_due'):
+        op.create_index(
+            'ix_task_proj_status_due',
+            'tasks',
+            ['project_id', 'status', 'due_datetime'],
+        )
+    if not index_exists('students', 'ix_student_proj_class'):
+        op.create_index(
+            'ix_student_proj_class',
+            'students',
+            ['project_id', 'class_name', 'section'],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_student_proj_class', table_name='students')
+    op.drop_index('ix_task_proj_status_due', table_name='tasks')
+    op.drop_index('ix_exam_proj_date', table_name='exam_records')
+    op.drop_index('ix_attendance_proj_date', table_name='attendance_records')
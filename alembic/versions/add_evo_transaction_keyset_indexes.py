@@ -0,0 +1,45 @@
+"""Add created_at keyset indexes on evo_point_transactions.
+
+Revision ID: add_evo_tx_keyset_indexes
+Revises: add_evo_name_snapshots
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_evo_tx_keyset_indexes'
+down_revision: Union[str, None] = 'add_evo_name_snapshots'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return index_name in {ix['name'] for ix in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    if not index_exists('evo_point_transactions', 'ix_evo_tx_user_proj_created'):
+        op.create_index(
+            'ix_evo_tx_user_proj_created',
+            'evo_point_transactions',
+            ['user_id', 'project_id', 'created_at'],
+        )
+    if not index_exists('evo_point_transactions', 'ix_evo_tx_proj_created'):
+        op.create_index(
+            'ix_evo_tx_proj_created',
+            'evo_point_transactions',
+            ['project_id', 'created_at'],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_evo_tx_proj_created', table_name='evo_point_transactions')
+    op.drop_index('ix_evo_tx_user_proj_created', table_name='evo_point_transactions')
@@ -0,0 +1,68 @@
+"""Add display-name snapshot columns to evo_point_transactions.
+
+Revision ID: add_evo_name_snapshots
+Revises: add_dashboard_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_evo_name_snapshots'
+down_revision: Union[str, None] = 'add_dashboard_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SNAPSHOT_COLUMNS = (
+    'user_name_snapshot',
+    'performed_by_name_snapshot',
+    'task_title_snapshot',
+)
+
+
+def column_exists(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    columns = [col['name'] for col in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Add snapshot columns and backfill them from users/tasks."""
+    for column_name in SNAPSHOT_COLUMNS:
+        if not column_exists('evo_point_transactions', column_name):
+            op.add_column(
+                'evo_point_transactions',
+                sa.Column(column_name, sa.String(255), nullable=True)
+            )
+
+    op.execute(sa.text("""
+        UPDATE evo_point_transactions t
+        SET user_name_snapshot = u.name
+        FROM users u
+        WHERE u.id = t.user_id AND t.user_name_snapshot IS NULL
+    """))
+    op.execute(sa.text("""
+        UPDATE evo_point_transactions t
+        SET performed_by_name_snapshot = u.name
+        FROM users u
+        WHERE u.id = t.performed_by_id AND t.performed_by_name_snapshot IS NULL
+    """))
+    op.execute(sa.text("""
+        UPDATE evo_point_transactions t
+        SET task_title_snapshot = tk.title
+        FROM tasks tk
+        WHERE tk.id = t.task_id AND t.task_title_snapshot IS NULL
+    """))
+
+
+def downgrade() -> None:
+    for column_name in reversed(SNAPSHOT_COLUMNS):
+        op.drop_column('evo_point_transactions', column_name)
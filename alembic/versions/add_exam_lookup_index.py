@@ -0,0 +1,38 @@
+"""Add per-exam lookup index on exam_records.
+
+Revision ID: add_exam_lookup_index
+Revises: add_users_leaderboard_index
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_exam_lookup_index'
+down_revision: Union[str, None] = 'add_users_leaderboard_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return index_name in {ix['name'] for ix in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    if not index_exists('exam_records', 'ix_exam_proj_exam_subject_date'):
+        op.create_index(
+            'ix_exam_proj_exam_subject_date',
+            'exam_records',
+            ['project_id', 'exam_name', 'subject', 'exam_date'],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_exam_proj_exam_subject_date', table_name='exam_records')
@@ -0,0 +1,40 @@
+"""Add partial index on active users' evo points for the leaderboard.
+
+Revision ID: add_users_leaderboard_index
+Revises: add_evo_tx_keyset_indexes
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_users_leaderboard_index'
+down_revision: Union[str, None] = 'add_evo_tx_keyset_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return index_name in {ix['name'] for ix in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    if not index_exists('users', 'ix_users_active_evo_points'):
+        op.create_index(
+            'ix_users_active_evo_points',
+            'users',
+            ['evo_points'],
+            postgresql_where=sa.text('is_active'),
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_active_evo_points', table_name='users')
@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.dependencies import ProjectContext, require_project_admin
 from app.schemas.dashboard import (
     DashboardResponse,
@@ -21,7 +21,7 @@ router = APIRouter()
 @router.get("", response_model=DashboardResponse)
 def get_dashboard(
     context: ProjectContext,
-    db: Annotated[Session, Depends(get_db)],
+    read_db: Annotated[Session, Depends(get_read_db)],
 ):
     """
     Get dashboard data based on project's allocated menus and user permissions.
@@ -32,7 +32,7 @@ def get_dashboard(
     
     Each widget section will only be included if the user has access to that feature.
     """
-    service = DashboardService(db)
+    service = DashboardService(read_db)
     return service.get_dashboard(
         project_id=context.project_id,
         user_id=context.user_id,
@@ -42,7 +42,7 @@ def get_dashboard(
 @router.get("/my-tasks", response_model=MyTasksReport)
 def get_my_tasks_report(
     context: ProjectContext,
-    db: Annotated[Session, Depends(get_db)],
+    read_db: Annotated[Session, Depends(get_read_db)],
 ):
     """
     Get the current user's task report.
@@ -51,7 +51,7 @@ def get_my_tasks_report(
     and a list of pending/in-progress tasks for the collapsible view.
     Accessible by all authenticated users with project access.
     """
-    service = DashboardService(db)
+    service = DashboardService(read_db)
     return service.get_my_tasks_report(
         project_id=context.project_id,
         user_id=context.user_id,
@@ -61,7 +61,7 @@ def get_my_tasks_report(
 @router.get("/project-stats", response_model=ProjectTaskStatsResponse)
 def get_project_task_stats(
     context: ProjectContext,
-    db: Annotated[Session, Depends(get_db)],
+    read_db: Annotated[Session, Depends(get_read_db)],
 ):
     """
     Get project-level task statistics.
@@ -69,7 +69,7 @@ def get_project_task_stats(
     Returns aggregate counts, status distribution for charts,
     and the evo points leaderboard. Accessible by all project members.
     """
-    service = DashboardService(db)
+    service = DashboardService(read_db)
     return service.get_project_task_stats(
         project_id=context.project_id,
     )
@@ -82,7 +82,7 @@ def get_project_task_stats(
 )
 def get_user_level_stats(
     context: ProjectContext,
-    db: Annotated[Session, Depends(get_db)],
+    read_db: Annotated[Session, Depends(get_read_db)],
 ):
     """
     Get per-user task statistics (admin only).
@@ -91,7 +91,7 @@ def get_user_level_stats(
     including today's tasks, status counts, and pending task lists.
     Requires project admin or super admin access.
     """
-    service = DashboardService(db)
+    service = DashboardService(read_db)
     return service.get_user_level_stats(
         project_id=context.project_id,
     )
@@ -1,5 +1,6 @@
 """Evo Points endpoints for gamification."""
 
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
@@ -9,7 +10,7 @@ from app.core.database import get_db
 from app.core.dependencies import ProjectContext, get_current_user, require_permission
 from app.models.evo_point import EvoTransactionType
 from app.models.user import User
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import CursorPaginatedResponse
 from app.schemas.evo_point import (
     EvoPointAdminCredit,
     EvoPointAdminDebit,
@@ -117,7 +118,7 @@ def debit_evo_points(
     )
 
 
-@router.get("/transactions", response_model=PaginatedResponse[EvoPointTransactionResponse])
+@router.get("/transactions", response_model=CursorPaginatedResponse[EvoPointTransactionResponse])
 def list_transactions(
     context: Annotated[ProjectContext, Depends(require_permission("evo_points:manage"))],
     db: Annotated[Session, Depends(get_db)],
@@ -125,24 +126,37 @@ def list_transactions(
     transaction_type: EvoTransactionType | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: Annotated[
+        datetime | None,
+        Query(description="created_at of the last transaction on the previous page"),
+    ] = None,
+    cursor_id: Annotated[
+        int | None,
+        Query(description="ID of the last transaction on the previous page"),
+    ] = None,
 ):
     """
     List all evo point transactions (admin view).
     Requires evo_points:manage permission.
+    Pass next_cursor/next_cursor_id from the previous response as
+    cursor/cursor_id for keyset paging.
     """
     service = EvoPointService(db)
-    transactions, total = service.get_transactions(
+    transactions, total, next_cursor = service.get_transactions(
         project_id=context.project_id,
         user_id=user_id,
         transaction_type=transaction_type,
         page=page,
         page_size=page_size,
+        cursor=(cursor, cursor_id) if cursor is not None and cursor_id is not None else None,
     )
 
-    return PaginatedResponse(
+    return CursorPaginatedResponse(
         items=transactions,
         total=total,
         page=page,
         page_size=page_size,
         total_pages=(total + page_size - 1) // page_size,
+        next_cursor=next_cursor[0] if next_cursor else None,
+        next_cursor_id=next_cursor[1] if next_cursor else None,
     )
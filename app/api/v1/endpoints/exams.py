@@ -1,7 +1,6 @@
 """Exam management endpoints."""
 
 from datetime import date
-from io import BytesIO
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, Query, Request, UploadFile
@@ -205,7 +204,7 @@ def download_exam_template(
     Requires exam:create permission.
     """
     service = ExamService(db)
-    content = service.generate_template(
+    output = service.generate_template(
         project_id=context.project_id,
         class_section=class_section,
         subject=subject,
@@ -225,7 +224,7 @@ def download_exam_template(
     filename += ".xlsx"
 
     return StreamingResponse(
-        BytesIO(content),
+        output,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
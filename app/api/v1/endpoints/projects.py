@@ -3,7 +3,7 @@
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -70,9 +70,14 @@ def list_user_projects(
 def list_all_projects(
     current_user: CurrentUser,
     db: Annotated[Session, Depends(get_db)],
+    after_name: str | None = Query(None, description="Name of the last project on the previous page"),
+    after_id: int | None = Query(None, description="ID of the last project on the previous page"),
+    limit: int | None = Query(None, ge=1, le=1000, description="Page size; omit to get every project"),
 ):
     """
     List all projects in the system (super admin only).
+    Ordered by name. Without limit every project is returned; to page, pass
+    limit plus after_name/after_id from the last item of the previous page.
     """
     if not current_user.is_super_admin:
         raise HTTPException(
@@ -80,7 +85,7 @@ def list_all_projects(
             detail="Only super admins can access all projects"
         )
     service = ProjectService(db)
-    return service.list_all_projects()
+    return service.list_all_projects(after_name=after_name, after_id=after_id, limit=limit)
 
 
 @router.get("/current", response_model=ProjectResponse)
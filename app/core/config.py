@@ -25,6 +25,8 @@ class Settings(BaseSettings):
 
     # Database - loaded from DATABASE_URL in .env file
     DATABASE_URL: PostgresDsn
+    # Optional read replica for read-only/reporting queries (falls back to DATABASE_URL)
+    READ_DATABASE_URL: PostgresDsn | None = None
 
     # JWT Settings
     JWT_SECRET_KEY: str = "your-super-secret-key-change-in-production"
@@ -27,6 +27,7 @@ engine = create_engine(
     max_overflow=10,
     pool_recycle=300,         # Recycle connections every 5 mins to avoid stale connections
     pool_timeout=30,          # Wait up to 30s for a connection from pool
+    executemany_mode="values_plus_batch",  # Batch executemany UPDATEs too, not just INSERTs
     connect_args={
         "connect_timeout": 10,       # Fail fast if can't connect in 10s
         "keepalives": 1,             # Enable TCP keepalives
@@ -36,6 +37,32 @@ engine = create_engine(
     },
 )
 
+# Read-only engine for reporting queries (dashboard aggregations).
+# Points at the read replica when READ_DATABASE_URL is set, otherwise reuses the primary.
+if settings.READ_DATABASE_URL:
+    read_engine = create_engine(
+        str(settings.READ_DATABASE_URL),
+        echo=False,
+        pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=10,
+        pool_recycle=300,
+        pool_timeout=30,
+        execution_options={
+            "isolation_level": "READ COMMITTED",
+            "postgresql_readonly": True,
+        },
+        connect_args={
+            "connect_timeout": 10,
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
+        },
+    )
+else:
+    read_engine = engine
+
 # Create sync session factory
 SessionLocal = sessionmaker(
     bind=engine,
@@ -45,6 +72,15 @@ SessionLocal = sessionmaker(
     autoflush=False,
 )
 
+# Session factory for read-only queries
+ReadSessionLocal = sessionmaker(
+    bind=read_engine,
+    class_=Session,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 
 def get_db() -> Generator[Session, None, None]:
     """Get database session dependency."""
@@ -59,5 +95,26 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
+def get_read_db(
+    db: Annotated[Session, Depends(get_db)],
+) -> Generator[Session, None, None]:
+    """Get read-only database session dependency (never commits).
+
+    Without a read replica this is the request's primary session, so a
+    request never holds two pooled connections to the same database.
+    """
+    if read_engine is engine:
+        yield db
+        return
+
+    session = ReadSessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
 # Type alias for dependency injection
 DbSession = Annotated[Session, Depends(get_db)]
+ReadDbSession = Annotated[Session, Depends(get_read_db)]
@@ -1,6 +1,6 @@
 """Database models package."""
 
-from app.models.attendance import AttendanceRecord, AttendanceStatus
+from app.models.attendance import AttendanceDailySummary, AttendanceRecord, AttendanceStatus
 from app.models.audit import AuditAction, AuditLog
 from app.models.evo_point import EvoPointTransaction, EvoTransactionType
 from app.models.exam import ExamRecord
@@ -44,6 +44,7 @@ __all__ = [
     # Attendance
     "AttendanceRecord",
     "AttendanceStatus",
+    "AttendanceDailySummary",
     # Exam
     "ExamRecord",
     # Upload
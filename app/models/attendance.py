@@ -3,7 +3,17 @@
 import enum
 from datetime import date
 
-from sqlalchemy import BigInteger, Date, Enum, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -81,6 +91,12 @@ class AttendanceRecord(Base, IDMixin, TimestampMixin, ProjectScopedMixin):
             "project_id", "student_id", "attendance_date",
             name="uq_attendance_student_date",
         ),
+        # Dashboard daily stats: index-only scan of a project's day
+        Index(
+            "ix_attendance_proj_date",
+            "project_id", "attendance_date",
+            postgresql_include=["status", "student_id"],
+        ),
     )
 
     @property
@@ -108,3 +124,33 @@ class AttendanceRecord(Base, IDMixin, TimestampMixin, ProjectScopedMixin):
 
     def __repr__(self) -> str:
         return f"<AttendanceRecord(student_id={self.student_id}, date={self.attendance_date})>"
+
+
+class AttendanceDailySummary(Base):
+    """Pre-aggregated attendance counts per class-section and day.
+
+    Rows are recomputed (app.services.attendance.refresh_daily_summary)
+    whenever attendance for a date is written or a student changes class or
+    is deleted, so dashboards can read per-class counts without
+    aggregating attendance_records on every request.
+    """
+
+    __tablename__ = "attendance_daily_summary"
+
+    project_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    attendance_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    class_name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    # Empty string when the class has no section (primary key columns can't be NULL)
+    section: Mapped[str] = mapped_column(String(50), primary_key=True, default="")
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    present_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<AttendanceDailySummary(project_id={self.project_id}, "
+            f"date={self.attendance_date}, class={self.class_name}-{self.section})>"
+        )
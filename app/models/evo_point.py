@@ -3,7 +3,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import ENUM as PgEnum, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +23,11 @@ class EvoPointTransaction(Base, IDMixin, TimestampMixin):
     """Ledger-style transaction log for evo points (append-only)."""
 
     __tablename__ = "evo_point_transactions"
+    __table_args__ = (
+        # Newest-first listings; scanned backward for created_at DESC
+        Index("ix_evo_tx_user_proj_created", "user_id", "project_id", "created_at"),
+        Index("ix_evo_tx_proj_created", "project_id", "created_at"),
+    )
 
     # User receiving/losing points
     user_id: Mapped[int] = mapped_column(
@@ -72,6 +77,12 @@ class EvoPointTransaction(Base, IDMixin, TimestampMixin):
     # Extra metadata (e.g., original points, reduction details, late completion info)
     extra_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
+    # Display names captured when the transaction is written, so listings
+    # don't need to join users/tasks
+    user_name_snapshot: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    performed_by_name_snapshot: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    task_title_snapshot: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
     # Relationships
     user: Mapped["User"] = relationship(
         "User",
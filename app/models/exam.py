@@ -3,7 +3,7 @@
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import DECIMAL, BigInteger, Date, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import DECIMAL, BigInteger, Date, ForeignKey, Index, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -55,6 +55,18 @@ class ExamRecord(Base, IDMixin, TimestampMixin, ProjectScopedMixin):
             "project_id", "student_id", "exam_name", "subject", "exam_date",
             name="uq_exam_student_subject_date",
         ),
+        # Per-exam lookups that don't pin a student (class sheets, summaries,
+        # bulk prefetch); the unique constraint leads with student_id
+        Index(
+            "ix_exam_proj_exam_subject_date",
+            "project_id", "exam_name", "subject", "exam_date",
+        ),
+        # Latest-exam lookup (ORDER BY exam_date DESC, created_at DESC uses a backward scan)
+        Index(
+            "ix_exam_proj_date",
+            "project_id", "exam_date", "created_at",
+            postgresql_include=["exam_name", "subject"],
+        ),
     )
 
     def __repr__(self) -> str:
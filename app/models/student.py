@@ -1,6 +1,6 @@
 """Student model."""
 
-from sqlalchemy import BigInteger, ForeignKey, String
+from sqlalchemy import BigInteger, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -36,5 +36,9 @@ class Student(Base, IDMixin, TimestampMixin, ProjectScopedMixin):
         lazy="selectin",
     )
 
+    __table_args__ = (
+        Index("ix_student_proj_class", "project_id", "class_name", "section"),
+    )
+
     def __repr__(self) -> str:
         return f"<Student(id={self.id}, name={self.student_name}, class={self.class_name})>"
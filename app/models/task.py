@@ -3,7 +3,7 @@
 import enum
 from datetime import date, datetime, time
 
-from sqlalchemy import BigInteger, Boolean, Date, DateTime, Enum, ForeignKey, Integer, String, Text, Time
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, Enum, ForeignKey, Index, Integer, String, Text, Time
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -186,6 +186,10 @@ class Task(Base, IDMixin, TimestampMixin, ProjectScopedMixin):
         lazy="selectin",
     )
 
+    __table_args__ = (
+        Index("ix_task_proj_status_due", "project_id", "status", "due_datetime"),
+    )
+
     def __repr__(self) -> str:
         return f"<Task(id={self.id}, title={self.title}, status={self.status})>"
 
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,6 +13,10 @@ class User(Base, IDMixin, TimestampMixin):
     """Global system user model."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Leaderboard ordering and rank counts over active users
+        Index("ix_users_active_evo_points", "evo_points", postgresql_where=text("is_active")),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     username: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
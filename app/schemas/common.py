@@ -36,6 +36,17 @@ class PaginatedResponse(BaseSchema, Generic[T]):
     total_pages: int
 
 
+class CursorPaginatedResponse(PaginatedResponse[T], Generic[T]):
+    """Paginated response that also carries a keyset cursor for the next page.
+
+    The cursor is the (next_cursor, next_cursor_id) pair; both are None on
+    the last page.
+    """
+
+    next_cursor: datetime | None = None
+    next_cursor_id: int | None = None
+
+
 class SuccessResponse(BaseSchema):
     """Standard success response."""
 
@@ -217,6 +217,7 @@ class ExamUploadResult(BaseSchema):
     failed_rows: int
     skipped_rows: int = 0
     errors: list[ExamUploadError] = []
+    errors_truncated: bool = False  # More rows failed than are listed in errors
     message: str
 
 
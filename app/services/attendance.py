@@ -2,6 +2,7 @@
 
 import calendar
 import logging
+from collections.abc import Iterable
 from datetime import date, datetime, timedelta
 from io import BytesIO
 from typing import Any
@@ -12,11 +13,12 @@ from openpyxl import Workbook, load_workbook
 logger = logging.getLogger(__name__)
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
 from openpyxl.utils import get_column_letter
-from sqlalchemy import func, select, and_, or_, Integer
+from sqlalchemy import case, delete, func, select, and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import NotFoundError, ValidationError
-from app.models.attendance import AttendanceRecord, AttendanceStatus
+from app.models.attendance import AttendanceDailySummary, AttendanceRecord, AttendanceStatus
 from app.models.student import Student
 from app.schemas.attendance import (
     AttendanceByClassResponse,
@@ -33,6 +35,65 @@ from app.schemas.attendance import (
 )
 
 
+def refresh_daily_summary(db: Session, project_id: int, dates: Iterable[date]) -> None:
+    """Recompute attendance_daily_summary rows for the given dates.
+
+    Must be called after the attendance writes have been flushed. Anything
+    that changes attendance rows or a student's class (not only the
+    attendance service) has to call this for the affected dates.
+    """
+    dates = set(dates)
+    if not dates:
+        return
+
+    # Drop stale rows first so classes with no remaining records disappear
+    db.execute(
+        delete(AttendanceDailySummary).where(
+            AttendanceDailySummary.project_id == project_id,
+            AttendanceDailySummary.attendance_date.in_(dates),
+        )
+    )
+
+    section = func.coalesce(Student.section, "")
+    aggregated = (
+        select(
+            AttendanceRecord.project_id,
+            AttendanceRecord.attendance_date,
+            Student.class_name,
+            section,
+            func.count(),
+            func.count().filter(
+                AttendanceRecord.status.in_((AttendanceStatus.PRESENT, AttendanceStatus.LATE))
+            ),
+        )
+        .join(Student, Student.id == AttendanceRecord.student_id)
+        .where(
+            AttendanceRecord.project_id == project_id,
+            AttendanceRecord.attendance_date.in_(dates),
+        )
+        .group_by(
+            AttendanceRecord.project_id,
+            AttendanceRecord.attendance_date,
+            Student.class_name,
+            section,
+        )
+    )
+
+    stmt = pg_insert(AttendanceDailySummary).from_select(
+        ["project_id", "attendance_date", "class_name", "section", "total", "present_count"],
+        aggregated,
+    )
+    # A concurrent writer may have refreshed the same day in between
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["project_id", "attendance_date", "class_name", "section"],
+        set_={
+            "total": stmt.excluded.total,
+            "present_count": stmt.excluded.present_count,
+        },
+    )
+    db.execute(stmt)
+
+
 class AttendanceService:
     """Attendance management service."""
 
@@ -84,6 +145,7 @@ class AttendanceService:
         self.db.add(record)
         self.db.flush()
         self.db.refresh(record)
+        self._refresh_daily_summary(project_id, [record.attendance_date])
 
         return AttendanceRecordResponse.model_validate(self._record_to_response(record))
 
@@ -195,6 +257,7 @@ class AttendanceService:
     ) -> AttendanceRecordResponse:
         """Update an attendance record."""
         record = self.get_record(record_id, project_id)
+        previous_date = record.attendance_date
 
         update_data = request.model_dump(exclude_unset=True)
         for field, value in update_data.items():
@@ -202,6 +265,7 @@ class AttendanceService:
 
         self.db.flush()
         self.db.refresh(record)
+        self._refresh_daily_summary(project_id, [previous_date, record.attendance_date])
 
         return AttendanceRecordResponse.model_validate(self._record_to_response(record))
 
@@ -212,8 +276,10 @@ class AttendanceService:
     ) -> None:
         """Delete an attendance record."""
         record = self.get_record(record_id, project_id)
+        attendance_date = record.attendance_date
         self.db.delete(record)
         self.db.flush()
+        self._refresh_daily_summary(project_id, [attendance_date])
 
     def get_summary(
         self,
@@ -226,10 +292,10 @@ class AttendanceService:
         """Get attendance summary for a date range."""
         query = select(
             func.count().label("total"),
-            func.sum(func.cast(AttendanceRecord.status == AttendanceStatus.PRESENT, Integer)).label("present"),
-            func.sum(func.cast(AttendanceRecord.status == AttendanceStatus.ABSENT, Integer)).label("absent"),
-            func.sum(func.cast(AttendanceRecord.status == AttendanceStatus.LATE, Integer)).label("late"),
-            func.sum(func.cast(AttendanceRecord.status == AttendanceStatus.EXCUSED, Integer)).label("excused"),
+            func.sum(case((AttendanceRecord.status == AttendanceStatus.PRESENT, 1), else_=0)).label("present"),
+            func.sum(case((AttendanceRecord.status == AttendanceStatus.ABSENT, 1), else_=0)).label("absent"),
+            func.sum(case((AttendanceRecord.status == AttendanceStatus.LATE, 1), else_=0)).label("late"),
+            func.sum(case((AttendanceRecord.status == AttendanceStatus.EXCUSED, 1), else_=0)).label("excused"),
         ).where(
             AttendanceRecord.project_id == project_id,
             AttendanceRecord.attendance_date >= date_from,
@@ -328,6 +394,7 @@ class AttendanceService:
                 failed += 1
 
         self.db.flush()
+        self._refresh_daily_summary(project_id, [request.attendance_date])
 
         return BulkAttendanceResponse(
             total_records=len(request.records),
@@ -738,6 +805,10 @@ class AttendanceService:
                 failed_rows += 1
 
         self.db.flush()
+        self._refresh_daily_summary(
+            project_id,
+            {att_date for _, entries in rows_to_process for att_date, _ in entries},
+        )
 
         # Log summary with counts per day
         total = successful_rows + failed_rows + skipped_rows
@@ -911,6 +982,10 @@ class AttendanceService:
             return parts[0], parts[1]
         return class_section, None
 
+    def _refresh_daily_summary(self, project_id: int, dates: Iterable[date]) -> None:
+        """Recompute attendance_daily_summary rows for the given dates."""
+        refresh_daily_summary(self.db, project_id, dates)
+
     def _get_students_by_class(
         self, project_id: int, class_name: str, section: str | None = None
     ) -> list[Student]:
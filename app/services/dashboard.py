@@ -1,12 +1,13 @@
 """Dashboard service for role-based widgets."""
 
-from datetime import date, datetime, timedelta, timezone
+from collections.abc import Container
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 
-from sqlalchemy import Integer, and_, func, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, and_, case, func, lambda_stmt, or_, select
+from sqlalchemy.orm import Session, lazyload, load_only
 
-from app.models.attendance import AttendanceRecord, AttendanceStatus
+from app.models.attendance import AttendanceDailySummary, AttendanceRecord, AttendanceStatus
 from app.models.exam import ExamRecord
 from app.models.menu_screen import MenuScreen, ProjectMenuScreen
 from app.models.project import Project
@@ -36,12 +37,32 @@ from app.schemas.dashboard import (
 # IST timezone (UTC+5:30)
 IST = timezone(timedelta(hours=5, minutes=30))
 
+# Pass mark as a fraction of max marks (40%)
+PASS_FRACTION = 0.4
+TWO_PLACES = Decimal("0.01")
+
+# Task statuses that can still become overdue
+_OPEN_STATES = frozenset({TaskStatus.PENDING, TaskStatus.IN_PROGRESS})
+
+
+class _AllPermissions:
+    """Permission container that matches every key (used for super admins)."""
+
+    def __contains__(self, item: object) -> bool:
+        return True
+
+
+_ALL_PERMISSIONS = _AllPermissions()
+
 
 class DashboardService:
     """Dashboard data aggregation service."""
 
-    def __init__(self, db: Session):
-        self.db = db
+    def __init__(self, read_db: Session):
+        # All dashboard queries are read-only and go through the read session
+        self.read_db = read_db
+        # Per-class student counts, shared by the attendance and student widgets
+        self._class_student_counts: dict[int, list[Row]] = {}
 
     def get_dashboard(
         self,
@@ -55,11 +76,24 @@ class DashboardService:
         1. Which menus are allocated to the project
         2. Which permissions the user has
         """
+        # Load the few user columns the widgets need once, up front
+        user = self.read_db.execute(
+            select(User.is_super_admin, User.evo_points).where(User.id == user_id)
+        ).one_or_none()
+        
         # Get widget configuration based on allocated menus and user permissions
-        widget_config = self._get_widget_config(project_id, user_id)
+        widget_config = self._get_widget_config(project_id, user_id, user)
         
         # Build response with only relevant data
         response = DashboardResponse(widget_config=widget_config)
+        if not any((
+            widget_config.show_tasks,
+            widget_config.show_attendance,
+            widget_config.show_exams,
+            widget_config.show_students,
+            widget_config.show_evo_points,
+        )):
+            return response
         
         if widget_config.show_tasks:
             response.tasks = self._get_task_stats(project_id, user_id)
@@ -76,7 +110,7 @@ class DashboardService:
             response.students = self._get_student_stats(project_id)
         
         if widget_config.show_evo_points:
-            response.evo_points = self._get_evo_stats(project_id, user_id)
+            response.evo_points = self._get_evo_stats(project_id, user_id, user)
         
         return response
 
@@ -84,13 +118,15 @@ class DashboardService:
         self,
         project_id: int,
         user_id: int,
+        user: Row | None,
     ) -> DashboardWidgetConfig:
         """Determine which widgets to show based on menu allocations and permissions."""
         # Get allocated menu names for the project
         allocated_menus = self._get_allocated_menu_names(project_id)
         
         # Get user's permission keys for this project
-        user_permissions = self._get_user_permissions(project_id, user_id)
+        is_super_admin = bool(user and user.is_super_admin)
+        user_permissions = self._get_user_permissions(project_id, user_id, is_super_admin)
         
         return DashboardWidgetConfig(
             show_tasks="Tasks" in allocated_menus and "task:view" in user_permissions,
@@ -103,28 +139,30 @@ class DashboardService:
 
     def _get_allocated_menu_names(self, project_id: int) -> set[str]:
         """Get set of allocated menu names for a project."""
-        result = self.db.execute(
-            select(MenuScreen.name)
+        # lambda_stmt caches the built statement; project_id becomes a bind parameter
+        stmt = lambda_stmt(
+            lambda: select(MenuScreen.name)
             .join(ProjectMenuScreen, ProjectMenuScreen.menu_screen_id == MenuScreen.id)
             .where(ProjectMenuScreen.project_id == project_id)
         )
+        result = self.read_db.execute(stmt)
         return {row[0] for row in result.all()}
 
-    def _get_user_permissions(self, project_id: int, user_id: int) -> set[str]:
+    def _get_user_permissions(
+        self,
+        project_id: int,
+        user_id: int,
+        is_super_admin: bool,
+    ) -> Container[str]:
         """Get user's permission keys for a project."""
-        # First check if user is super admin (has all permissions)
-        user = self.db.execute(
-            select(User).where(User.id == user_id)
-        ).scalar_one_or_none()
-        
-        if user and user.is_super_admin:
-            # Return all permission keys
-            result = self.db.execute(select(Permission.permission_key))
-            return {row[0] for row in result.all()}
+        # Super admins have all permissions
+        if is_super_admin:
+            # Only membership is checked, so skip loading every permission key
+            return _ALL_PERMISSIONS
         
         # Get permissions through user's roles in this project
-        result = self.db.execute(
-            select(Permission.permission_key)
+        stmt = lambda_stmt(
+            lambda: select(Permission.permission_key)
             .join(RolePermission, RolePermission.permission_id == Permission.id)
             .join(UserRoleProject, UserRoleProject.role_id == RolePermission.role_id)
             .where(
@@ -132,6 +170,7 @@ class DashboardService:
                 UserRoleProject.project_id == project_id,
             )
         )
+        result = self.read_db.execute(stmt)
         return {row[0] for row in result.all()}
 
     def _get_task_stats(
@@ -142,13 +181,19 @@ class DashboardService:
         """Get task statistics for dashboard."""
         now = datetime.now(IST)
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        # Get all tasks for the project
-        query = select(Task).where(Task.project_id == project_id)
-        result = self.db.execute(query)
-        tasks = result.scalars().all()
+        tomorrow_start = today_start + timedelta(days=1)
+        
+        # Stream the project's tasks in batches, loading only the columns used
+        # below and skipping the model's eager-loaded relationships
+        query = (
+            select(Task)
+            .options(load_only(Task.status, Task.end_time, Task.due_datetime), lazyload("*"))
+            .where(Task.project_id == project_id)
+            .execution_options(yield_per=1000)
+        )
         
         # Count by status
+        total = 0
         pending = 0
         in_progress = 0
         done = 0
@@ -157,7 +202,8 @@ class DashboardService:
         completed_today = 0
         due_today = 0
         
-        for task in tasks:
+        for task in self.read_db.execute(query).scalars():
+            total += 1
             if task.status == TaskStatus.PENDING:
                 pending += 1
             elif task.status == TaskStatus.IN_PROGRESS:
@@ -170,18 +216,16 @@ class DashboardService:
             elif task.status == TaskStatus.CANCELLED:
                 cancelled += 1
             
-            # Check overdue (pending/in_progress tasks past due)
-            if task.due_datetime and task.status in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS):
-                if task.due_datetime < now:
+            due = task.due_datetime
+            if due is not None:
+                # Check overdue (pending/in_progress tasks past due)
+                if task.status in _OPEN_STATES and due < now:
                     overdue += 1
-            
-            # Check due today
-            if task.due_datetime:
-                task_due_date = task.due_datetime.date() if task.due_datetime.tzinfo else task.due_datetime.date()
-                if task_due_date == now.date():
+                
+                # Check due today (compared in IST, not the datetime's own tz)
+                if today_start <= due < tomorrow_start:
                     due_today += 1
         
-        total = len(tasks)
         completion_rate = (done / total * 100) if total > 0 else 0.0
         
         return TaskDashboardStats(
@@ -204,32 +248,33 @@ class DashboardService:
         target_date: date,
     ) -> AttendanceDashboardStats:
         """Get attendance statistics for a specific date."""
-        # Get total students in project
-        total_students_result = self.db.execute(
-            select(func.count()).where(Student.project_id == project_id)
-        )
-        total_students = total_students_result.scalar() or 0
-        
-        # Get attendance counts for the date
+        total_students = self._get_total_students(project_id)
+
+        # Per-status counts plus a ROLLUP grand-total row (status NULL)
         query = select(
-            func.count().label("total"),
-            func.sum(func.cast(AttendanceRecord.status == AttendanceStatus.PRESENT, Integer)).label("present"),
-            func.sum(func.cast(AttendanceRecord.status == AttendanceStatus.ABSENT, Integer)).label("absent"),
-            func.sum(func.cast(AttendanceRecord.status == AttendanceStatus.LATE, Integer)).label("late"),
-            func.sum(func.cast(AttendanceRecord.status == AttendanceStatus.EXCUSED, Integer)).label("excused"),
+            AttendanceRecord.status,
+            func.count().label("count"),
         ).where(
             AttendanceRecord.project_id == project_id,
             AttendanceRecord.attendance_date == target_date,
+        ).group_by(
+            func.rollup(AttendanceRecord.status),
         )
-        
-        result = self.db.execute(query)
-        row = result.one()
-        
-        total_records = row.total or 0
-        present_count = row.present or 0
-        absent_count = row.absent or 0
-        late_count = row.late or 0
-        excused_count = row.excused or 0
+
+        result = self.read_db.execute(query)
+
+        total_records = 0
+        status_counts: dict[AttendanceStatus, int] = {}
+        for row in result.all():
+            if row.status is None:
+                total_records = row.count
+            else:
+                status_counts[row.status] = row.count
+
+        present_count = status_counts.get(AttendanceStatus.PRESENT, 0)
+        absent_count = status_counts.get(AttendanceStatus.ABSENT, 0)
+        late_count = status_counts.get(AttendanceStatus.LATE, 0)
+        excused_count = status_counts.get(AttendanceStatus.EXCUSED, 0)
         
         # Calculate present rate (including late as present for rate calculation)
         attendance_captured = total_records > 0
@@ -254,58 +299,73 @@ class DashboardService:
         target_date: date,
     ) -> list[AttendanceByClassStat]:
         """Get attendance stats per class for a specific date."""
-        # Get all class-sections with student counts
-        class_query = select(
-            Student.class_name,
-            Student.section,
-            func.count().label("total"),
-        ).where(
-            Student.project_id == project_id
-        ).group_by(
-            Student.class_name,
-            Student.section,
-        ).order_by(
-            Student.class_name,
-            Student.section,
-        )
-        
-        class_result = self.db.execute(class_query)
-        classes = class_result.all()
-        
+        classes = self._get_class_student_counts(project_id)
+        present_by_class = self._get_present_counts_by_class(project_id, target_date)
+
         stats = []
         for class_row in classes:
             class_name = class_row.class_name
             section = class_row.section or ""
             class_section = f"{class_name}-{section}" if section else class_name
             total_students = class_row.total
-            
-            # Get present count for this class on this date
-            present_query = select(func.count()).where(
-                AttendanceRecord.project_id == project_id,
-                AttendanceRecord.attendance_date == target_date,
-                AttendanceRecord.class_name == class_name,
-                or_(
-                    AttendanceRecord.status == AttendanceStatus.PRESENT,
-                    AttendanceRecord.status == AttendanceStatus.LATE,
-                ),
-            )
-            if section:
-                present_query = present_query.where(AttendanceRecord.section == section)
-            
-            present_result = self.db.execute(present_query)
-            present_count = present_result.scalar() or 0
-            
+            present_count = present_by_class.get((class_name, section), 0)
+
             present_rate = (present_count / total_students * 100) if total_students > 0 else 0.0
-            
+
             stats.append(AttendanceByClassStat(
                 class_section=class_section,
                 total_students=total_students,
                 present_count=present_count,
                 present_rate=round(present_rate, 1),
             ))
-        
+
         return stats
 
+    def _get_present_counts_by_class(
+        self,
+        project_id: int,
+        target_date: date,
+    ) -> dict[tuple[str, str], int]:
+        """Get present (incl. late) counts keyed by (class_name, section) for a date.
+
+        Reads the pre-aggregated attendance_daily_summary table and falls back
+        to live aggregation when no summary rows exist for the date.
+        """
+        summary_stmt = lambda_stmt(
+            lambda: select(
+                AttendanceDailySummary.class_name,
+                AttendanceDailySummary.section,
+                AttendanceDailySummary.present_count,
+            ).where(
+                AttendanceDailySummary.project_id == project_id,
+                AttendanceDailySummary.attendance_date == target_date,
+            )
+        )
+        summary_rows = self.read_db.execute(summary_stmt).all()
+        if summary_rows:
+            return {(row.class_name, row.section): row.present_count for row in summary_rows}
+
+        section = func.coalesce(Student.section, "")
+        live_rows = self.read_db.execute(
+            select(
+                Student.class_name,
+                section.label("section"),
+                func.count().label("present_count"),
+            )
+            .select_from(AttendanceRecord)
+            .join(Student, Student.id == AttendanceRecord.student_id)
+            .where(
+                AttendanceRecord.project_id == project_id,
+                AttendanceRecord.attendance_date == target_date,
+                or_(
+                    AttendanceRecord.status == AttendanceStatus.PRESENT,
+                    AttendanceRecord.status == AttendanceStatus.LATE,
+                ),
+            )
+            .group_by(Student.class_name, section)
+        ).all()
+        return {(row.class_name, row.section): row.present_count for row in live_rows}
+
     def _get_exam_stats(self, project_id: int) -> ExamDashboardStats:
         """Get latest exam statistics."""
         # Find the most recent exam
@@ -320,7 +380,7 @@ class DashboardService:
             ExamRecord.created_at.desc(),
         ).limit(1)
         
-        latest = self.db.execute(latest_exam_query).first()
+        latest = self.read_db.execute(latest_exam_query).first()
         
         if not latest:
             return ExamDashboardStats()
@@ -329,12 +389,20 @@ class DashboardService:
         subject = latest.subject
         exam_date = latest.exam_date
         
-        # Get statistics for this exam
+        # Get statistics for this exam (pass = 40% of max marks); aggregates are
+        # COALESCEd so the row never carries NULLs
         stats_query = select(
             func.count().label("total"),
-            func.avg(ExamRecord.marks_obtained).label("avg"),
-            func.max(ExamRecord.marks_obtained).label("highest"),
-            func.min(ExamRecord.marks_obtained).label("lowest"),
+            func.coalesce(func.avg(ExamRecord.marks_obtained), 0).label("avg"),
+            func.coalesce(func.max(ExamRecord.marks_obtained), 0).label("highest"),
+            func.coalesce(func.min(ExamRecord.marks_obtained), 0).label("lowest"),
+            func.coalesce(
+                func.sum(case(
+                    (ExamRecord.marks_obtained >= ExamRecord.max_marks * PASS_FRACTION, 1),
+                    else_=0,
+                )),
+                0,
+            ).label("passed"),
         ).where(
             ExamRecord.project_id == project_id,
             ExamRecord.exam_name == exam_name,
@@ -342,21 +410,11 @@ class DashboardService:
             ExamRecord.exam_date == exam_date,
         )
         
-        result = self.db.execute(stats_query)
+        result = self.read_db.execute(stats_query)
         row = result.one()
         
-        total_students = row.total or 0
-        
-        # Count pass (40% of max marks)
-        pass_percentage = Decimal("0.4")
-        pass_query = select(func.count()).where(
-            ExamRecord.project_id == project_id,
-            ExamRecord.exam_name == exam_name,
-            ExamRecord.subject == subject,
-            ExamRecord.exam_date == exam_date,
-            ExamRecord.marks_obtained >= ExamRecord.max_marks * pass_percentage,
-        )
-        pass_count = self.db.execute(pass_query).scalar() or 0
+        total_students = row.total
+        pass_count = row.passed
         
         pass_rate = (pass_count / total_students * 100) if total_students > 0 else 0.0
         
@@ -365,7 +423,8 @@ class DashboardService:
             recent_exam_subject=subject,
             recent_exam_date=exam_date,
             total_students=total_students,
-            average_marks=Decimal(str(row.avg or 0)).quantize(Decimal("0.01")) if row.avg else None,
+            # AVG over a NUMERIC column already comes back as Decimal
+            average_marks=row.avg.quantize(TWO_PLACES) if total_students > 0 else None,
             pass_rate=round(pass_rate, 1),
             highest_marks=row.highest,
             lowest_marks=row.lowest,
@@ -373,96 +432,95 @@ class DashboardService:
 
     def _get_student_stats(self, project_id: int) -> StudentDashboardStats:
         """Get student statistics."""
-        # Get total count
-        total_query = select(func.count()).where(Student.project_id == project_id)
-        total_students = self.db.execute(total_query).scalar() or 0
-        
-        # Get count by class
-        class_query = select(
-            Student.class_name,
-            Student.section,
-            func.count().label("count"),
-        ).where(
-            Student.project_id == project_id
-        ).group_by(
-            Student.class_name,
-            Student.section,
-        ).order_by(
-            Student.class_name,
-            Student.section,
-        )
-        
-        result = self.db.execute(class_query)
-        classes = result.all()
-        
         by_class = []
-        for row in classes:
+        for row in self._get_class_student_counts(project_id):
             class_section = f"{row.class_name}-{row.section}" if row.section else row.class_name
             by_class.append(ClassStudentCount(
                 class_section=class_section,
-                student_count=row.count,
+                student_count=row.total,
             ))
         
         return StudentDashboardStats(
-            total_students=total_students,
+            total_students=self._get_total_students(project_id),
             class_count=len(by_class),
             by_class=by_class,
         )
 
+    def _get_class_student_counts(self, project_id: int) -> list[Row]:
+        """Get (class_name, section, total) student counts, memoized per service instance."""
+        if project_id not in self._class_student_counts:
+            class_query = select(
+                Student.class_name,
+                Student.section,
+                func.count().label("total"),
+            ).where(
+                Student.project_id == project_id
+            ).group_by(
+                Student.class_name,
+                Student.section,
+            ).order_by(
+                Student.class_name,
+                Student.section,
+            )
+            self._class_student_counts[project_id] = list(self.read_db.execute(class_query).all())
+        return self._class_student_counts[project_id]
+
+    def _get_total_students(self, project_id: int) -> int:
+        """Get total students in a project from the per-class counts."""
+        return sum(row.total for row in self._get_class_student_counts(project_id))
+
     def _get_evo_stats(
         self,
         project_id: int,
         user_id: int,
+        user: Row | None,
     ) -> EvoDashboardStats:
-        """Get evo points statistics for dashboard."""
-        # Get current user's balance
-        user = self.db.execute(
-            select(User).where(User.id == user_id)
-        ).scalar_one_or_none()
-        
+        """Get evo points statistics for dashboard.
+
+        ``user`` is the current user's (is_super_admin, evo_points) row, or None.
+        """
         current_balance = user.evo_points if user else 0
         
-        # Get top 5 users by evo points
-        # Only consider users who are part of this project
-        leaderboard_query = (
-            select(User)
-            .join(UserRoleProject, UserRoleProject.user_id == User.id)
-            .where(
-                User.is_active == True,
-                UserRoleProject.project_id == project_id,
-            )
-            .distinct()
-            .order_by(User.evo_points.desc())
-            .limit(5)
-        )
-        
-        result = self.db.execute(leaderboard_query)
-        users = result.scalars().all()
-        
-        leaderboard = [
-            EvoLeaderboardEntry(
-                rank=idx + 1,
-                user_id=u.id,
-                user_name=u.name,
-                points=u.evo_points,
+        # Rank active project members once; the same pass yields the top 5
+        # (row_number) and the current user's competition rank (rank)
+        ranked = (
+            select(
+                User.id,
+                User.name,
+                User.evo_points,
+                func.row_number().over(order_by=(User.evo_points.desc(), User.id)).label("position"),
+                func.rank().over(order_by=User.evo_points.desc()).label("rank"),
             )
-            for idx, u in enumerate(users)
-        ]
-        
-        # Calculate current user's rank within the project
-        current_user_rank = None
-        if user:
-            rank_query = select(func.count()).where(
+            .where(
                 User.is_active == True,
                 User.id.in_(
                     select(UserRoleProject.user_id).where(
                         UserRoleProject.project_id == project_id
                     )
                 ),
-                User.evo_points > current_balance,
             )
-            users_above = self.db.execute(rank_query).scalar() or 0
-            current_user_rank = users_above + 1
+            .subquery()
+        )
+        leaderboard_query = (
+            select(ranked)
+            .where(or_(ranked.c.position <= 5, ranked.c.id == user_id))
+            .order_by(ranked.c.position)
+        )
+        
+        result = self.read_db.execute(leaderboard_query)
+        
+        leaderboard = []
+        current_user_rank = None
+        for row in result.all():
+            if row.position <= 5:
+                leaderboard.append(EvoLeaderboardEntry(
+                    rank=row.position,
+                    user_id=row.id,
+                    user_name=row.name,
+                    points=row.evo_points,
+                ))
+            if row.id == user_id:
+                current_user_rank = row.rank
         
         return EvoDashboardStats(
             current_user_balance=current_balance,
@@ -481,14 +539,17 @@ class DashboardService:
     ) -> MyTasksReport:
         """Get current user's task report (Section 1)."""
         now = datetime.now(IST)
-        today_date = now.date()
+        # Half-open IST day window; comparing datetimes avoids per-task .date() calls
+        # that would bucket by the datetime's own timezone
+        today_start = datetime.combine(now.date(), time.min, tzinfo=IST)
+        tomorrow_start = today_start + timedelta(days=1)
 
         # Fetch tasks assigned to this user in this project
         query = select(Task).where(
             Task.project_id == project_id,
             Task.assigned_to_user_id == user_id,
         )
-        tasks = list(self.db.execute(query).scalars().all())
+        tasks = list(self.read_db.execute(query).scalars().all())
 
         pending = 0
         in_progress = 0
@@ -518,12 +579,10 @@ class DashboardService:
                     is_overdue = True
 
             # Due today
-            if task.due_datetime:
-                task_due_date = task.due_datetime.date()
-                if task_due_date == today_date:
-                    today_total += 1
-                    if task.status == TaskStatus.DONE:
-                        today_completed += 1
+            if task.due_datetime and today_start <= task.due_datetime < tomorrow_start:
+                today_total += 1
+                if task.status == TaskStatus.DONE:
+                    today_completed += 1
 
             # Pending/in-progress tasks for the collapsible list
             if task.status in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS):
@@ -561,7 +620,7 @@ class DashboardService:
         now = datetime.now(IST)
 
         query = select(Task).where(Task.project_id == project_id)
-        tasks = list(self.db.execute(query).scalars().all())
+        tasks = list(self.read_db.execute(query).scalars().all())
 
         pending = 0
         in_progress = 0
@@ -587,7 +646,7 @@ class DashboardService:
         total_tasks = pending + in_progress + done + cancelled
 
         # Evo leaderboard (reuse logic)
-        evo_stats = self._get_evo_stats(project_id, user_id=0)
+        evo_stats = self._get_evo_stats(project_id, user_id=0, user=None)
 
         return ProjectTaskStatsResponse(
             pending_count=pending,
@@ -612,7 +671,10 @@ class DashboardService:
     ) -> UserLevelStatsResponse:
         """Get per-user task statistics for admin view (Section 3)."""
         now = datetime.now(IST)
-        today_date = now.date()
+        # Half-open IST day window; comparing datetimes avoids per-task .date() calls
+        # that would bucket by the datetime's own timezone
+        today_start = datetime.combine(now.date(), time.min, tzinfo=IST)
+        tomorrow_start = today_start + timedelta(days=1)
 
         # Get all users in this project
         users_query = (
@@ -624,11 +686,11 @@ class DashboardService:
             )
             .distinct()
         )
-        project_users = list(self.db.execute(users_query).scalars().all())
+        project_users = list(self.read_db.execute(users_query).scalars().all())
 
         # Get ALL tasks in this project in a single query
         all_tasks = list(
-            self.db.execute(
+            self.read_db.execute(
                 select(Task).where(Task.project_id == project_id)
             ).scalars().all()
         )
@@ -673,16 +735,18 @@ class DashboardService:
                         u_overdue += 1
                         is_overdue = True
 
-                if task.due_datetime:
-                    task_due_date = task.due_datetime.date()
-                    if task_due_date == today_date:
-                        u_today_total += 1
-                        if task.status == TaskStatus.DONE:
-                            u_today_completed += 1
+                is_due_today = (
+                    task.due_datetime is not None
+                    and today_start <= task.due_datetime < tomorrow_start
+                )
+                if is_due_today:
+                    u_today_total += 1
+                    if task.status == TaskStatus.DONE:
+                        u_today_completed += 1
 
                 # Pending/in-progress tasks due today for dropdown
                 if task.status in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS):
-                    if task.due_datetime and task.due_datetime.date() == today_date:
+                    if is_due_today:
                         u_pending_items.append(TaskListItem(
                             id=task.id,
                             title=task.title,
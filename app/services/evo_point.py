@@ -3,8 +3,8 @@
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, insert, select, tuple_, update
+from sqlalchemy.orm import Session, lazyload
 
 from app.core.exceptions import NotFoundError, ValidationError
 from app.models.evo_point import EvoPointTransaction, EvoTransactionType
@@ -23,11 +23,93 @@ from app.schemas.evo_point import (
 IST = timezone(timedelta(hours=5, minutes=30))
 
 
+def _gradual_reduction_kernel(
+    full_points: int,
+    due_ts: float,
+    ext_ts: float,
+    comp_ts: float,
+) -> int:
+    """
+    Linear decay on unix timestamps: full_points at due_ts down to 0 at ext_ts.
+    
+    Kept free of datetime objects so batch scoring only pays for the arithmetic;
+    works in whole seconds with integer math, so there is no float rounding.
+    """
+    total = int(ext_ts - due_ts)
+    if total <= 0:
+        return 0
+    
+    # If completed at or after extension end, no points
+    remaining = total - int(comp_ts - due_ts)
+    if remaining <= 0:
+        return 0
+    
+    return (full_points * remaining) // total
+
+
+def _as_ist(value: datetime | None) -> datetime | None:
+    """Attach IST to naive datetimes; aware values and None pass through."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=IST)
+
+
+TASK_REWARD_REASON = "Completed task: "
+
+
+def _task_reward_extra(
+    task: Task,
+    effective_points: int,
+    reduction_applied: int,
+    was_late: bool,
+) -> dict[str, Any]:
+    """extra_data for a task reward; reduction details only when late."""
+    if was_late:
+        return dict(
+            task_title=task.title,
+            original_points=effective_points,
+            was_late=True,
+            reduction_applied=reduction_applied,
+            reduction_type=task.evo_reduction_type.value,
+        )
+    return dict(task_title=task.title, original_points=effective_points, was_late=False)
+
+
+def _reward_kernel(
+    full_points: int,
+    reduction_type: EvoReductionType,
+    fixed_points: int,
+    due_ts: float,
+    ext_ts: float | None,
+    comp_ts: float,
+) -> int:
+    """
+    Reward for a completion on unix timestamps.
+    
+    ext_ts is None when the task has no extension (grace period) configured.
+    """
+    # Completed on time, or late completions aren't penalized
+    if comp_ts <= due_ts or reduction_type == EvoReductionType.NONE:
+        return full_points
+    
+    if reduction_type == EvoReductionType.GRADUAL:
+        # No extension configured, nothing for a late completion
+        if ext_ts is None:
+            return 0
+        return _gradual_reduction_kernel(full_points, due_ts, ext_ts, comp_ts)
+    
+    # FIXED: reduced amount while late, 0 once the extension has passed
+    if ext_ts is not None and comp_ts >= ext_ts:
+        return 0
+    return max(0, full_points - fixed_points)
+
+
 class EvoPointService:
     """Service for managing evo points transactions and calculations."""
 
     def __init__(self, db: Session):
         self.db = db
+        self._project_defaults_cache: dict[int, int] = {}
 
     def get_user(self, user_id: int) -> User:
         """Get user by ID or raise NotFoundError."""
@@ -36,12 +118,41 @@ class EvoPointService:
             raise NotFoundError(f"User with id {user_id} not found")
         return user
 
+    def _apply_delta(self, user_id: int, delta: int) -> tuple[int, str]:
+        """
+        Atomically add delta to a user's balance.
+        
+        One UPDATE ... RETURNING, so concurrent adjustments can't lose
+        each other's writes. Returns (new balance, user name).
+        """
+        row = self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(evo_points=User.evo_points + delta)
+            .returning(User.evo_points, User.name)
+        ).one_or_none()
+        if row is None:
+            raise NotFoundError(f"User with id {user_id} not found")
+        return row.evo_points, row.name
+
+    def _get_user_name(self, user_id: int) -> str | None:
+        """Get just the user's display name."""
+        return self.db.execute(
+            select(User.name).where(User.id == user_id)
+        ).scalar()
+
     def get_project_default_evo_points(self, project_id: int) -> int:
         """Get the default evo points setting for a project."""
-        project = self.db.get(Project, project_id)
-        if not project:
-            return 0
-        return project.default_evo_points
+        if project_id in self._project_defaults_cache:
+            return self._project_defaults_cache[project_id]
+        
+        default_points = self.db.execute(
+            select(Project.default_evo_points).where(Project.id == project_id)
+        ).scalar()
+        if default_points is None:
+            default_points = 0
+        self._project_defaults_cache[project_id] = default_points
+        return default_points
 
     def get_effective_evo_points(self, task: Task, project_id: int) -> int:
         """Get the effective evo points for a task (task value or project default)."""
@@ -74,99 +185,34 @@ class EvoPointService:
             completion_time = completion_time.replace(tzinfo=IST)
         
         full_points = self.get_effective_evo_points(task, project_id)
-        
-        # If no due_datetime or no reduction configured, return full points
-        if not task.due_datetime or task.evo_reduction_type == EvoReductionType.NONE:
-            return full_points
-        
-        due_datetime = task.due_datetime
-        if due_datetime.tzinfo is None:
-            due_datetime = due_datetime.replace(tzinfo=IST)
-        
-        # If completed on time, return full points
-        if completion_time <= due_datetime:
-            return full_points
-        
-        # Task is late - apply reduction based on type
-        if task.evo_reduction_type == EvoReductionType.GRADUAL:
-            return self._calculate_gradual_reduction(
-                full_points=full_points,
-                due_datetime=due_datetime,
-                extension_end=task.evo_extension_end,
-                completion_time=completion_time,
-            )
-        elif task.evo_reduction_type == EvoReductionType.FIXED:
-            return self._calculate_fixed_reduction(
-                full_points=full_points,
-                fixed_points=task.evo_fixed_reduction_points or 0,
-                extension_end=task.evo_extension_end,
-                completion_time=completion_time,
-            )
-        
-        return full_points
+        due_datetime, extension_end = self._task_deadlines(task)
+        return self._reward_for(task, full_points, due_datetime, extension_end, completion_time)
 
-    def _calculate_gradual_reduction(
-        self,
-        full_points: int,
-        due_datetime: datetime,
-        extension_end: datetime | None,
-        completion_time: datetime,
-    ) -> int:
-        """
-        Calculate points with gradual linear decay.
-        
-        Points decay linearly from full_points at due_datetime to 0 at extension_end.
-        """
-        if extension_end is None:
-            # No extension configured, return 0 if late
-            return 0
-        
-        if extension_end.tzinfo is None:
-            extension_end = extension_end.replace(tzinfo=IST)
-        
-        # If completed after extension end, no points
-        if completion_time >= extension_end:
-            return 0
-        
-        # Linear interpolation
-        total_decay_seconds = (extension_end - due_datetime).total_seconds()
-        elapsed_seconds = (completion_time - due_datetime).total_seconds()
-        
-        if total_decay_seconds <= 0:
-            return 0
-        
-        remaining_ratio = 1 - (elapsed_seconds / total_decay_seconds)
-        return max(0, int(full_points * remaining_ratio))
+    def _task_deadlines(self, task: Task) -> tuple[datetime | None, datetime | None]:
+        """Task due time and extension end, normalized to aware datetimes once."""
+        return _as_ist(task.due_datetime), _as_ist(task.evo_extension_end)
 
-    def _calculate_fixed_reduction(
+    def _reward_for(
         self,
+        task: Task,
         full_points: int,
-        fixed_points: int,
+        due_datetime: datetime | None,
         extension_end: datetime | None,
         completion_time: datetime,
     ) -> int:
-        """
-        Calculate points with fixed reduction after due time.
-        
-        fixed_points is the amount to SUBTRACT from full_points.
-        Returns (full_points - fixed_points) if completed between due_datetime and extension_end.
-        Returns 0 if completed after extension_end.
-        """
-        reduced_amount = max(0, full_points - fixed_points)
-        
-        if extension_end is None:
-            # No extension, return reduced points for any late completion
-            return reduced_amount
-        
-        if extension_end.tzinfo is None:
-            extension_end = extension_end.replace(tzinfo=IST)
-        
-        # If completed after extension end, no points
-        if completion_time >= extension_end:
-            return 0
+        """Reward for a task given its pre-normalized deadlines."""
+        # Without a due date there is nothing to be late for
+        if due_datetime is None:
+            return full_points
         
-        # Within grace period, return reduced points
-        return reduced_amount
+        return _reward_kernel(
+            full_points=full_points,
+            reduction_type=task.evo_reduction_type,
+            fixed_points=task.evo_fixed_reduction_points or 0,
+            due_ts=due_datetime.timestamp(),
+            ext_ts=extension_end.timestamp() if extension_end is not None else None,
+            comp_ts=completion_time.timestamp(),
+        )
 
     def award_task_points(
         self,
@@ -189,6 +235,7 @@ class EvoPointService:
         """
         if completion_time is None:
             completion_time = datetime.now(IST)
+        completion_time = _as_ist(completion_time)
         
         # Only user-assigned tasks can earn points
         if task.assigned_to_user_id is None or task.assigned_to_user_id != user_id:
@@ -198,6 +245,8 @@ class EvoPointService:
                 new_balance=None,
             )
         
+        # Every remaining path reports the balance, so load the user once
+        user = self.get_user(user_id)
         effective_points = self.get_effective_evo_points(task, project_id)
         
         # If task has no evo points, skip
@@ -205,45 +254,31 @@ class EvoPointService:
             return TaskCompletionResult(
                 task_id=task.id,
                 points_earned=0,
-                new_balance=self.get_user_balance(user_id),
+                new_balance=user.evo_points,
             )
         
-        # Calculate actual reward
-        actual_points = self.calculate_reward_points(task, project_id, completion_time)
-        
-        # Check if late
-        was_late = False
-        if task.due_datetime:
-            due_dt = task.due_datetime
-            if due_dt.tzinfo is None:
-                due_dt = due_dt.replace(tzinfo=IST)
-            was_late = completion_time > due_dt
+        # Calculate actual reward, normalizing the deadlines once for both checks
+        due_dt, ext_dt = self._task_deadlines(task)
+        actual_points = self._reward_for(task, effective_points, due_dt, ext_dt, completion_time)
+        was_late = due_dt is not None and completion_time > due_dt
         
         # Credit the points
         if actual_points > 0:
-            user = self.get_user(user_id)
-            new_balance = user.evo_points + actual_points
-            user.evo_points = new_balance
+            new_balance, _ = self._apply_delta(user_id, actual_points)
             
             # Create transaction record
-            metadata = {
-                "task_title": task.title,
-                "original_points": effective_points,
-                "was_late": was_late,
-            }
-            if was_late:
-                metadata["reduction_applied"] = effective_points - actual_points
-                metadata["reduction_type"] = task.evo_reduction_type.value
-            
+            reduction_applied = max(0, effective_points - actual_points)
             transaction = EvoPointTransaction(
                 user_id=user_id,
                 project_id=project_id,
                 transaction_type=EvoTransactionType.TASK_REWARD.value,
                 amount=actual_points,
                 balance_after=new_balance,
-                reason=f"Completed task: {task.title}",
+                reason=TASK_REWARD_REASON + task.title,
                 task_id=task.id,
-                metadata=metadata,
+                extra_data=_task_reward_extra(task, effective_points, reduction_applied, was_late),
+                user_name_snapshot=user.name,
+                task_title_snapshot=task.title,
             )
             self.db.add(transaction)
             self.db.flush()
@@ -254,13 +289,13 @@ class EvoPointService:
                 new_balance=new_balance,
                 was_late=was_late,
                 original_points=effective_points if was_late else None,
-                reduction_applied=effective_points - actual_points if was_late else None,
+                reduction_applied=reduction_applied if was_late else None,
             )
         
         return TaskCompletionResult(
             task_id=task.id,
             points_earned=0,
-            new_balance=self.get_user_balance(user_id),
+            new_balance=user.evo_points,
             was_late=was_late,
             original_points=effective_points,
             reduction_applied=effective_points,
@@ -290,22 +325,23 @@ class EvoPointService:
         if amount <= 0:
             raise ValidationError("Credit amount must be positive")
         
-        user = self.get_user(user_id)
-        new_balance = user.evo_points + amount
-        user.evo_points = new_balance
-        
-        transaction = EvoPointTransaction(
-            user_id=user_id,
-            project_id=project_id,
-            transaction_type=EvoTransactionType.ADMIN_CREDIT.value,
-            amount=amount,
-            balance_after=new_balance,
-            reason=reason,
-            performed_by_id=performed_by_id,
-        )
-        self.db.add(transaction)
-        self.db.flush()
-        self.db.refresh(transaction)
+        new_balance, user_name = self._apply_delta(user_id, amount)
+        
+        transaction = self.db.execute(
+            insert(EvoPointTransaction)
+            .values(
+                user_id=user_id,
+                project_id=project_id,
+                transaction_type=EvoTransactionType.ADMIN_CREDIT.value,
+                amount=amount,
+                balance_after=new_balance,
+                reason=reason,
+                performed_by_id=performed_by_id,
+                user_name_snapshot=user_name,
+                performed_by_name_snapshot=self._get_user_name(performed_by_id),
+            )
+            .returning(EvoPointTransaction)
+        ).scalar_one()
         
         return self._enrich_transaction(transaction)
 
@@ -333,33 +369,33 @@ class EvoPointService:
         if amount <= 0:
             raise ValidationError("Debit amount must be positive")
         
-        user = self.get_user(user_id)
-        new_balance = user.evo_points - amount
-        
         # Allow negative balance (configurable in the future)
-        user.evo_points = new_balance
-        
-        transaction = EvoPointTransaction(
-            user_id=user_id,
-            project_id=project_id,
-            transaction_type=EvoTransactionType.ADMIN_DEBIT.value,
-            amount=-amount,  # Store as negative for debit
-            balance_after=new_balance,
-            reason=reason,
-            performed_by_id=performed_by_id,
-        )
-        self.db.add(transaction)
-        self.db.flush()
-        self.db.refresh(transaction)
+        new_balance, user_name = self._apply_delta(user_id, -amount)
+        
+        transaction = self.db.execute(
+            insert(EvoPointTransaction)
+            .values(
+                user_id=user_id,
+                project_id=project_id,
+                transaction_type=EvoTransactionType.ADMIN_DEBIT.value,
+                amount=-amount,  # Store as negative for debit
+                balance_after=new_balance,
+                reason=reason,
+                performed_by_id=performed_by_id,
+                user_name_snapshot=user_name,
+                performed_by_name_snapshot=self._get_user_name(performed_by_id),
+            )
+            .returning(EvoPointTransaction)
+        ).scalar_one()
         
         return self._enrich_transaction(transaction)
 
     def get_user_balance(self, user_id: int) -> int:
         """Get current evo points balance for a user."""
-        user = self.db.get(User, user_id)
-        if not user:
-            return 0
-        return user.evo_points
+        balance = self.db.execute(
+            select(User.evo_points).where(User.id == user_id)
+        ).scalar()
+        return balance if balance is not None else 0
 
     def get_user_balance_with_transactions(
         self,
@@ -368,10 +404,16 @@ class EvoPointService:
         limit: int = 10,
     ) -> EvoPointBalanceResponse:
         """Get user's balance with recent transactions."""
-        user = self.get_user(user_id)
+        # Only the three columns the response needs; no User object hydration
+        user = self.db.execute(
+            select(User.id, User.name, User.evo_points).where(User.id == user_id)
+        ).one_or_none()
+        if user is None:
+            raise NotFoundError(f"User with id {user_id} not found")
         
         query = (
             select(EvoPointTransaction)
+            .options(lazyload("*"))
             .where(EvoPointTransaction.user_id == user_id)
             .order_by(EvoPointTransaction.created_at.desc())
             .limit(limit)
@@ -399,35 +441,53 @@ class EvoPointService:
         transaction_type: EvoTransactionType | None = None,
         page: int = 1,
         page_size: int = 50,
-    ) -> tuple[list[EvoPointTransactionResponse], int]:
-        """Get transactions with filtering."""
-        query = select(EvoPointTransaction)
+        cursor: tuple[datetime, int] | None = None,
+    ) -> tuple[list[EvoPointTransactionResponse], int, tuple[datetime, int] | None]:
+        """
+        Get transactions with filtering, newest first.
         
+        Pass the previous page's next_cursor, a (created_at, id) pair, as
+        cursor to page by keyset instead of OFFSET; page is then ignored.
+        
+        Returns:
+            (transactions, total matching, next_cursor or None on the last page)
+        """
+        filters = []
         if project_id:
-            query = query.where(EvoPointTransaction.project_id == project_id)
+            filters.append(EvoPointTransaction.project_id == project_id)
         if user_id:
-            query = query.where(EvoPointTransaction.user_id == user_id)
+            filters.append(EvoPointTransaction.user_id == user_id)
         if transaction_type:
-            query = query.where(EvoPointTransaction.transaction_type == transaction_type)
+            filters.append(EvoPointTransaction.transaction_type == transaction_type)
         
-        # Count total
-        count_result = self.db.execute(
-            select(func.count()).select_from(query.subquery())
-        )
-        total = count_result.scalar() or 0
+        # Count total directly on the table (no derived-table wrapper)
+        total = self.db.execute(
+            select(func.count(EvoPointTransaction.id)).where(*filters)
+        ).scalar_one()
         
-        # Get paginated results
+        # Get paginated results; id breaks ties between equal timestamps
         query = (
-            query
-            .order_by(EvoPointTransaction.created_at.desc())
-            .offset((page - 1) * page_size)
+            select(EvoPointTransaction)
+            .where(*filters)
+            .options(lazyload("*"))
+            .order_by(EvoPointTransaction.created_at.desc(), EvoPointTransaction.id.desc())
             .limit(page_size)
         )
+        if cursor is not None:
+            query = query.where(
+                tuple_(EvoPointTransaction.created_at, EvoPointTransaction.id) < cursor
+            )
+        else:
+            query = query.offset((page - 1) * page_size)
         
         result = self.db.execute(query)
         transactions = result.scalars().all()
+        next_cursor = None
+        if len(transactions) == page_size:
+            last = transactions[-1]
+            next_cursor = (last.created_at, last.id)
         
-        return [self._enrich_transaction(t) for t in transactions], total
+        return [self._enrich_transaction(t) for t in transactions], total, next_cursor
 
     def get_leaderboard(
         self,
@@ -436,39 +496,46 @@ class EvoPointService:
         current_user_id: int | None = None,
     ) -> EvoPointLeaderboardResponse:
         """Get evo points leaderboard."""
-        # Get top users by evo_points
-        query = (
-            select(User)
+        # Top N come straight off ix_users_active_evo_points (index order +
+        # LIMIT); the current user's rank is an index range count. Both are
+        # uncorrelated, so Postgres runs the rank subquery once per call.
+        current_user_rank_col = None
+        if current_user_id:
+            current_points = (
+                select(User.evo_points)
+                .where(User.id == current_user_id, User.is_active == True)
+                .scalar_subquery()
+            )
+            users_ahead = (
+                select(func.count())
+                .where(User.is_active == True, User.evo_points > current_points)
+                .scalar_subquery()
+            )
+            current_user_rank_col = case(
+                (current_points.is_(None), None),
+                else_=users_ahead + 1,
+            ).label("current_user_rank")
+        
+        columns = [User.id, User.name, User.evo_points]
+        if current_user_rank_col is not None:
+            columns.append(current_user_rank_col)
+        rows = self.db.execute(
+            select(*columns)
             .where(User.is_active == True)
-            .order_by(User.evo_points.desc())
+            .order_by(User.evo_points.desc(), User.id)
             .limit(limit)
-        )
-        
-        result = self.db.execute(query)
-        users = result.scalars().all()
+        ).all()
         
         entries = [
             EvoPointLeaderboardEntry(
-                rank=idx + 1,
-                user_id=user.id,
-                user_name=user.name,
-                evo_points=user.evo_points,
+                rank=position,
+                user_id=row.id,
+                user_name=row.name,
+                evo_points=row.evo_points,
             )
-            for idx, user in enumerate(users)
+            for position, row in enumerate(rows, start=1)
         ]
-        
-        # Get current user's rank if provided
-        current_user_rank = None
-        if current_user_id:
-            rank_query = select(func.count()).where(
-                User.is_active == True,
-                User.evo_points > (
-                    select(User.evo_points).where(User.id == current_user_id).scalar_subquery()
-                )
-            )
-            rank_result = self.db.execute(rank_query)
-            users_above = rank_result.scalar() or 0
-            current_user_rank = users_above + 1
+        current_user_rank = rows[0].current_user_rank if rows and current_user_id else None
         
         return EvoPointLeaderboardResponse(
             entries=entries,
@@ -492,7 +559,7 @@ class EvoPointService:
             performed_by_id=transaction.performed_by_id,
             extra_data=transaction.extra_data,
             created_at=transaction.created_at,
-            user_name=transaction.user.name if transaction.user else None,
-            performed_by_name=transaction.performed_by.name if transaction.performed_by else None,
-            task_title=transaction.task.title if transaction.task else None,
+            user_name=transaction.user_name_snapshot,
+            performed_by_name=transaction.performed_by_name_snapshot,
+            task_title=transaction.task_title_snapshot,
         )
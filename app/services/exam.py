@@ -2,15 +2,21 @@
 
 import calendar
 import logging
-from datetime import date, timedelta
+import re
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from io import BytesIO
+from operator import itemgetter
 
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import get_column_letter
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, lazyload, load_only, selectinload
 
 from app.core.exceptions import NotFoundError, ValidationError
 from app.models.exam import ExamRecord
@@ -33,6 +39,159 @@ from app.schemas.exam import (
 
 logger = logging.getLogger(__name__)
 
+# Template styles, built once and shared by every cell of every workbook
+_TITLE_FONT = Font(bold=True, size=14)
+_TITLE_FILL = PatternFill(start_color="B4C6E7", end_color="B4C6E7", fill_type="solid")
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+_THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+_CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
+_BOLD_FONT = Font(bold=True)
+
+# 1-based column index -> letter ("A", "B", ...); index 0 is unused
+_COLUMN_LETTERS = ("",) + tuple(get_column_letter(i) for i in range(1, 1025))
+
+# Exam Records sheet column widths, in header order
+_TEMPLATE_COLUMN_WIDTHS = (
+    25,  # Student Name
+    10,  # Grade
+    25,  # Exam Name
+    15,  # Subject
+    12,  # Exam Date
+    12,  # Max Marks
+    15,  # Marks Obtained
+    12,  # Grade (Auto)
+    20,  # Remarks
+)
+
+
+# Lower bound (percentage) of each grade band, ascending; bisect_right gives
+# the index into _GRADE_LABELS (below 33 -> "F", 90 and above -> "A+")
+_GRADE_THRESHOLDS = (33, 40, 50, 60, 70, 80, 90)
+_GRADE_LABELS = ("F", "D", "C", "C+", "B", "B+", "A", "A+")
+# Far below the smallest real gap to a band edge for DECIMAL(10, 2) marks
+_GRADE_EPSILON = 1e-9
+
+# Cell text that stands for "no value" (exports of empty cells)
+_NONE_LIKE = frozenset({
+    "", "none", "None", "NONE", "null", "Null", "NULL", "nan", "NaN", "NAN",
+})
+
+# Max marks assumed when an upload row leaves the column blank or unreadable
+_DEFAULT_MAX_MARKS = Decimal("100")
+
+# Upload exam date cell: date part of "2024-01-15" or "2024-01-15 00:00:00"
+_EXAM_DATE_RE = re.compile(r"(\d+)-(\d+)-(\d+)(?:\s|$)")
+
+# Most row errors an upload result lists; the rest are only counted
+_MAX_UPLOAD_ERRORS = 1000
+
+# Rows per executemany batch in the upload upsert, and per upload write chunk
+_UPSERT_BATCH_SIZE = 1000
+
+
+# Normalized (lowercased, stripped) upload header -> col_map field
+_HEADER_ALIASES = {
+    "student name": "student_name",
+    "student": "student_name",
+    "grade": "grade",
+    "class": "grade",
+    "class grade": "grade",
+    "grade/class": "grade",
+    "exam name": "exam_name",
+    "exam": "exam_name",
+    "subject": "subject",
+    "exam date": "exam_date",
+    "date": "exam_date",
+    "max marks": "max_marks",
+    "maximum marks": "max_marks",
+    "marks obtained": "marks_obtained",
+    "obtained marks": "marks_obtained",
+    "marks": "marks_obtained",
+    "grade (auto)": "grade_col",
+    "remarks": "remarks",
+    "remark": "remarks",
+}
+
+
+def _match_header(header: str) -> str | None:
+    """Substring fallback for headers that aren't a known alias."""
+    if "student" in header and "name" in header:
+        return "student_name"
+    if "grade" in header and "class" in header:
+        return "grade"
+    if "exam" in header and "name" in header:
+        return "exam_name"
+    if "subject" in header:
+        return "subject"
+    if "date" in header:
+        return "exam_date"
+    if "max" in header:
+        return "max_marks"
+    if "obtained" in header or "marks" in header:
+        return "marks_obtained"
+    if "remark" in header:
+        return "remarks"
+    return None
+
+
+def _parse_exam_date(value: str, default: date) -> date:
+    """Parse 'YYYY-MM-DD' (optionally followed by a time); default otherwise."""
+    match = _EXAM_DATE_RE.match(value)
+    if match:
+        try:
+            return date(int(match[1]), int(match[2]), int(match[3]))
+        except ValueError:
+            pass
+    return default
+
+
+def _none_if_placeholder(value: str | None) -> str | None:
+    """Treat an empty cell or a placeholder like "None"/"null" as missing."""
+    if not value or value in _NONE_LIKE:
+        return None
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _parse_class_section(class_section: str) -> tuple[str, str | None]:
+    """Parse class-section string like '3-A' into (class_name, section)."""
+    if "-" in class_section:
+        parts = class_section.rsplit("-", 1)
+        return parts[0], parts[1]
+    return class_section, None
+
+
+def _grade_case(marks_obtained, max_marks):
+    """SQL CASE mirroring ExamService._calculate_grade."""
+    percentage = marks_obtained * 100 / max_marks
+    return case(
+        (max_marks == 0, "N/A"),
+        (percentage >= 90, "A+"),
+        (percentage >= 80, "A"),
+        (percentage >= 70, "B+"),
+        (percentage >= 60, "B"),
+        (percentage >= 50, "C+"),
+        (percentage >= 40, "C"),
+        (percentage >= 33, "D"),
+        else_="F",
+    )
+
+
+# Batch-load just the student fields _record_to_response reads; without the
+# lazyload the student's selectin attendance/exam collections load too
+_RECORD_STUDENT_LOADS = (
+    selectinload(ExamRecord.student).options(
+        load_only(Student.student_name, Student.class_name, Student.section),
+        lazyload("*"),
+    ),
+)
+
 
 class ExamService:
     """Exam record management service."""
@@ -90,27 +249,32 @@ class ExamService:
         if not grade:
             grade = self._calculate_grade(request.marks_obtained, request.max_marks)
 
-        record = ExamRecord(
-            project_id=project_id,
-            student_id=request.student_id,
-            exam_name=request.exam_name,
-            subject=request.subject,
-            exam_date=request.exam_date,
-            max_marks=request.max_marks,
-            marks_obtained=request.marks_obtained,
-            grade=grade,
-            remarks=request.remarks,
-        )
-        self.db.add(record)
-        self.db.flush()
-        self.db.refresh(record)
+        # INSERT ... RETURNING hands back the complete row in the same roundtrip;
+        # record.student resolves from the identity map (loaded just above)
+        record = self.db.execute(
+            insert(ExamRecord)
+            .values(
+                project_id=project_id,
+                student_id=request.student_id,
+                exam_name=request.exam_name,
+                subject=request.subject,
+                exam_date=request.exam_date,
+                max_marks=request.max_marks,
+                marks_obtained=request.marks_obtained,
+                grade=grade,
+                remarks=request.remarks,
+            )
+            .returning(ExamRecord)
+        ).scalar_one()
 
         return ExamRecordResponse.model_validate(self._record_to_response(record))
 
     def _get_student(self, project_id: int, student_id: int) -> Student:
         """Get student by ID, validating project membership."""
         result = self.db.execute(
-            select(Student).where(
+            select(Student)
+            .options(lazyload("*"))
+            .where(
                 Student.id == student_id,
                 Student.project_id == project_id,
             )
@@ -139,27 +303,25 @@ class ExamService:
         result = self.db.execute(query)
         return result.scalar_one_or_none()
 
-    def _calculate_grade(self, marks_obtained: Decimal, max_marks: Decimal) -> str:
-        """Calculate grade based on percentage."""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _calculate_grade(marks_obtained: Decimal, max_marks: Decimal) -> str:
+        """Calculate grade based on percentage.
+
+        Memoized: a sheet repeats the same max marks and many marks values.
+        """
         if max_marks == 0:
             return "N/A"
-        percentage = (marks_obtained / max_marks) * 100
-        if percentage >= 90:
-            return "A+"
-        elif percentage >= 80:
-            return "A"
-        elif percentage >= 70:
-            return "B+"
-        elif percentage >= 60:
-            return "B"
-        elif percentage >= 50:
-            return "C+"
-        elif percentage >= 40:
-            return "C"
-        elif percentage >= 33:
-            return "D"
-        else:
-            return "F"
+        # Float math avoids Decimal division; the tiny nudge keeps exact band edges
+        # (e.g. 10.2/17 = 60%) from rounding just below the threshold
+        percentage = float(marks_obtained) * 100.0 / float(max_marks) + _GRADE_EPSILON
+        return _GRADE_LABELS[bisect_right(_GRADE_THRESHOLDS, percentage)]
+
+    def _calculate_grades(
+        self, marks: list[Decimal], max_marks: list[Decimal]
+    ) -> list[str]:
+        """Grade many (marks_obtained, max_marks) pairs in one pass."""
+        return [self._calculate_grade(m, mx) for m, mx in zip(marks, max_marks, strict=True)]
 
     def get_record(
         self,
@@ -168,7 +330,9 @@ class ExamService:
     ) -> ExamRecord:
         """Get exam record by ID."""
         result = self.db.execute(
-            select(ExamRecord).where(
+            select(ExamRecord)
+            .options(*_RECORD_STUDENT_LOADS)
+            .where(
                 ExamRecord.id == record_id,
                 ExamRecord.project_id == project_id,
             )
@@ -186,19 +350,22 @@ class ExamService:
         page_size: int = 50,
     ) -> tuple[list[ExamRecordResponse], int]:
         """List exam records with filtering."""
-        query = select(ExamRecord).where(ExamRecord.project_id == project_id)
+        # Filters are collected once and applied to both the count and the page
+        # query, so the count runs flat instead of wrapping the page query
+        conditions = [ExamRecord.project_id == project_id]
+        join_student = False
 
         if filters:
             if filters.student_id:
-                query = query.where(ExamRecord.student_id == filters.student_id)
+                conditions.append(ExamRecord.student_id == filters.student_id)
             if filters.exam_name:
-                query = query.where(ExamRecord.exam_name == filters.exam_name)
+                conditions.append(ExamRecord.exam_name == filters.exam_name)
             if filters.subject:
-                query = query.where(ExamRecord.subject == filters.subject)
+                conditions.append(ExamRecord.subject == filters.subject)
             if filters.date_from:
-                query = query.where(ExamRecord.exam_date >= filters.date_from)
+                conditions.append(ExamRecord.exam_date >= filters.date_from)
             if filters.date_to:
-                query = query.where(ExamRecord.exam_date <= filters.date_to)
+                conditions.append(ExamRecord.exam_date <= filters.date_to)
             if filters.month and filters.year:
                 # Filter by month and year
                 start_date = date(filters.year, filters.month, 1)
@@ -206,28 +373,33 @@ class ExamService:
                     end_date = date(filters.year + 1, 1, 1) - timedelta(days=1)
                 else:
                     end_date = date(filters.year, filters.month + 1, 1) - timedelta(days=1)
-                query = query.where(ExamRecord.exam_date >= start_date)
-                query = query.where(ExamRecord.exam_date <= end_date)
+                conditions.append(ExamRecord.exam_date >= start_date)
+                conditions.append(ExamRecord.exam_date <= end_date)
             if filters.class_section:
                 # Parse class_section like "3-A" into class_name and section
-                class_name, section = self._parse_class_section(filters.class_section)
-                query = query.join(Student).where(Student.class_name == class_name)
+                class_name, section = _parse_class_section(filters.class_section)
+                join_student = True
+                conditions.append(Student.class_name == class_name)
                 if section:
-                    query = query.where(Student.section == section)
+                    conditions.append(Student.section == section)
             elif filters.class_name:
-                query = query.join(Student).where(Student.class_name == filters.class_name)
+                join_student = True
+                conditions.append(Student.class_name == filters.class_name)
                 if filters.section:
-                    query = query.where(Student.section == filters.section)
+                    conditions.append(Student.section == filters.section)
 
         # Count total
-        count_result = self.db.execute(
-            select(func.count()).select_from(query.subquery())
-        )
-        total = count_result.scalar() or 0
+        count_query = select(func.count(ExamRecord.id)).select_from(ExamRecord)
+        query = select(ExamRecord).options(*_RECORD_STUDENT_LOADS)
+        if join_student:
+            count_query = count_query.join(Student)
+            query = query.join(Student)
+        total = self.db.execute(count_query.where(*conditions)).scalar() or 0
 
         # Apply pagination and ordering
         query = (
             query
+            .where(*conditions)
             .order_by(ExamRecord.exam_date.desc(), ExamRecord.exam_name)
             .offset((page - 1) * page_size)
             .limit(page_size)
@@ -236,7 +408,8 @@ class ExamService:
         result = self.db.execute(query)
         records = result.scalars().all()
 
-        return [ExamRecordResponse.model_validate(self._record_to_response(r)) for r in records], total
+        # Rows come straight from the database, so skip re-validating each one
+        return [ExamRecordResponse.model_construct(**self._record_to_response(r)) for r in records], total
 
     def update_record(
         self,
@@ -265,8 +438,9 @@ class ExamService:
         if request.marks_obtained is not None and request.grade is None:
             record.grade = self._calculate_grade(record.marks_obtained, record.max_marks)
 
+        # Every column is already current on the instance (updated_at is set
+        # client-side by onupdate), so no refresh SELECT is needed
         self.db.flush()
-        self.db.refresh(record)
 
         return ExamRecordResponse.model_validate(self._record_to_response(record))
 
@@ -295,6 +469,11 @@ class ExamService:
             func.avg(ExamRecord.marks_obtained).label("avg"),
             func.max(ExamRecord.marks_obtained).label("highest"),
             func.min(ExamRecord.marks_obtained).label("lowest"),
+            # Pass count comes from the same scan as the other aggregates
+            func.sum(case(
+                (ExamRecord.marks_obtained >= ExamRecord.max_marks * pass_percentage, 1),
+                else_=0,
+            )).label("pass_count"),
         ).where(
             ExamRecord.project_id == project_id,
             ExamRecord.exam_name == exam_name,
@@ -304,17 +483,7 @@ class ExamService:
         result = self.db.execute(query)
         row = result.one()
 
-        # Count pass/fail
-        pass_count_result = self.db.execute(
-            select(func.count()).where(
-                ExamRecord.project_id == project_id,
-                ExamRecord.exam_name == exam_name,
-                ExamRecord.subject == subject,
-                ExamRecord.marks_obtained >= ExamRecord.max_marks * pass_percentage,
-            )
-        )
-        pass_count = pass_count_result.scalar() or 0
-
+        pass_count = int(row.pass_count or 0)
         total = row.total or 0
         fail_count = total - pass_count
 
@@ -339,66 +508,84 @@ class ExamService:
         request: BulkExamCreate,
     ) -> BulkExamResponse:
         """Create or update exam records in bulk for a class."""
-        errors = []
         successful = 0
-        failed = 0
 
         # Parse class section
-        class_name, section = self._parse_class_section(request.class_section)
+        class_name, section = _parse_class_section(request.class_section)
 
         # Get all students for the class
         students = self._get_students_by_class(project_id, class_name, section)
         student_ids = {s.id for s in students}
 
         # Validate all student IDs before any DB operations
-        for record in request.records:
-            if record.student_id not in student_ids:
-                errors.append({
-                    "student_id": record.student_id,
-                    "message": f"Student ID {record.student_id} not found in class {request.class_section}",
-                })
-                failed += 1
+        errors = [
+            {
+                "student_id": record.student_id,
+                "message": f"Student ID {record.student_id} not found in class {request.class_section}",
+            }
+            for record in request.records
+            if record.student_id not in student_ids
+        ]
 
         if errors:
             return BulkExamResponse(
                 total_records=len(request.records),
                 successful=0,
-                failed=failed,
+                failed=len(errors),
                 errors=errors,
                 message="Validation failed. No records were saved.",
             )
 
-        # All validations passed, proceed with DB operations
+        # Marks above the maximum are rejected up front, in one pass
+        max_marks = request.max_marks
+        errors.extend(
+            {
+                "student_id": record.student_id,
+                "message": f"Marks obtained ({record.marks_obtained}) exceeds max marks ({max_marks})",
+            }
+            for record in request.records
+            if record.marks_obtained > max_marks
+        )
+
+        # All validations passed; fetch every existing record for this exam in one query
+        existing_result = self.db.execute(
+            select(ExamRecord).options(lazyload("*")).where(
+                ExamRecord.project_id == project_id,
+                ExamRecord.exam_name == request.exam_name,
+                ExamRecord.subject == request.subject,
+                ExamRecord.exam_date == request.exam_date,
+                ExamRecord.student_id.in_([r.student_id for r in request.records]),
+            )
+        )
+        existing_map = {r.student_id: r for r in existing_result.scalars().all()}
+
+        new_records: list[ExamRecord] = []
+        updates: list[dict] = []
+        auto_grade_ids: list[int] = []
         for record in request.records:
+            if record.marks_obtained > max_marks:
+                continue
             try:
-                # Validate marks
-                if record.marks_obtained > request.max_marks:
-                    errors.append({
-                        "student_id": record.student_id,
-                        "message": f"Marks obtained ({record.marks_obtained}) exceeds max marks ({request.max_marks})",
-                    })
-                    failed += 1
-                    continue
-
-                existing = self._get_existing_record(
-                    project_id, record.student_id, request.exam_name, request.subject, request.exam_date
-                )
+                existing = existing_map.get(record.student_id)
 
-                # Calculate grade if not provided
-                grade = record.grade
-                if not grade:
-                    grade = self._calculate_grade(record.marks_obtained, request.max_marks)
+                # Missing grades are filled in by one SQL UPDATE after the writes
+                grade = record.grade or None
+                if grade is None:
+                    auto_grade_ids.append(record.student_id)
 
                 if existing:
-                    # Update existing record
-                    existing.marks_obtained = record.marks_obtained
-                    existing.max_marks = request.max_marks
-                    existing.exam_date = request.exam_date
-                    existing.grade = grade
-                    existing.remarks = record.remarks
+                    # Update existing record (emitted below as one executemany)
+                    updates.append({
+                        "id": existing.id,
+                        "marks_obtained": record.marks_obtained,
+                        "max_marks": request.max_marks,
+                        "exam_date": request.exam_date,
+                        "grade": grade,
+                        "remarks": record.remarks,
+                    })
                 else:
                     # Create new record
-                    new_record = ExamRecord(
+                    new_records.append(ExamRecord(
                         project_id=project_id,
                         student_id=record.student_id,
                         exam_name=request.exam_name,
@@ -408,8 +595,7 @@ class ExamService:
                         marks_obtained=record.marks_obtained,
                         grade=grade,
                         remarks=record.remarks,
-                    )
-                    self.db.add(new_record)
+                    ))
 
                 successful += 1
             except Exception as e:
@@ -417,14 +603,30 @@ class ExamService:
                     "student_id": record.student_id,
                     "message": str(e),
                 })
-                failed += 1
 
+        if updates:
+            self.db.execute(update(ExamRecord), updates)
+        self.db.add_all(new_records)
         self.db.flush()
 
+        if auto_grade_ids:
+            self.db.execute(
+                update(ExamRecord)
+                .where(
+                    ExamRecord.project_id == project_id,
+                    ExamRecord.exam_name == request.exam_name,
+                    ExamRecord.subject == request.subject,
+                    ExamRecord.exam_date == request.exam_date,
+                    ExamRecord.student_id.in_(auto_grade_ids),
+                )
+                .values(grade=_grade_case(ExamRecord.marks_obtained, ExamRecord.max_marks))
+                .execution_options(synchronize_session=False)
+            )
+
         return BulkExamResponse(
             total_records=len(request.records),
             successful=successful,
-            failed=failed,
+            failed=len(errors),
             errors=errors,
             message=f"Successfully saved {successful} exam records.",
         )
@@ -437,35 +639,56 @@ class ExamService:
         subject: str,
     ) -> ExamByClassResponse:
         """Get all student exam records for a class for a specific exam/subject."""
-        class_name, section = self._parse_class_section(class_section)
+        class_name, section = _parse_class_section(class_section)
 
         # Get all students in the class
         students = self._get_students_by_class(project_id, class_name, section)
 
-        # Get existing exam records
+        # Get existing exam records (students are already loaded above).
+        # A student can have this exam on several dates; entries and stats
+        # both use the latest one per student (DISTINCT ON student_id).
+        conditions = (
+            ExamRecord.project_id == project_id,
+            ExamRecord.exam_name == exam_name,
+            ExamRecord.subject == subject,
+            ExamRecord.student_id.in_([s.id for s in students]),
+        )
+        latest_per_student = (
+            ExamRecord.student_id,
+            ExamRecord.exam_date.desc(),
+            ExamRecord.id.desc(),
+        )
         result = self.db.execute(
-            select(ExamRecord).where(
-                ExamRecord.project_id == project_id,
-                ExamRecord.exam_name == exam_name,
-                ExamRecord.subject == subject,
-                ExamRecord.student_id.in_([s.id for s in students]),
-            )
+            select(ExamRecord)
+            .options(lazyload("*"))
+            .where(*conditions)
+            .distinct(ExamRecord.student_id)
+            .order_by(*latest_per_student)
         )
         records = {r.student_id: r for r in result.scalars().all()}
 
+        # Class statistics computed by the database over the same rows
+        latest = (
+            select(ExamRecord.marks_obtained, ExamRecord.max_marks, ExamRecord.exam_date)
+            .where(*conditions)
+            .distinct(ExamRecord.student_id)
+            .order_by(*latest_per_student)
+            .subquery()
+        )
+        stats = self.db.execute(
+            select(
+                func.avg(latest.c.marks_obtained).label("avg"),
+                func.max(latest.c.marks_obtained).label("highest"),
+                func.min(latest.c.marks_obtained).label("lowest"),
+                func.max(latest.c.max_marks).label("max_marks"),
+                func.max(latest.c.exam_date).label("exam_date"),
+            )
+        ).one()
+
         # Build response with all students
         student_data = []
-        marks_list = []
-        max_marks_value = None
-        exam_date_value = None
-
         for student in students:
             record = records.get(student.id)
-            if record:
-                marks_list.append(record.marks_obtained)
-                max_marks_value = record.max_marks
-                exam_date_value = record.exam_date
-
             student_data.append(StudentExamEntry(
                 student_id=student.id,
                 student_name=student.student_name,
@@ -478,22 +701,17 @@ class ExamService:
                 record_id=record.id if record else None,
             ))
 
-        # Calculate statistics
-        average = sum(marks_list) / len(marks_list) if marks_list else None
-        highest = max(marks_list) if marks_list else None
-        lowest = min(marks_list) if marks_list else None
-
         return ExamByClassResponse(
             class_section=class_section,
             exam_name=exam_name,
             subject=subject,
-            exam_date=exam_date_value,
-            max_marks=max_marks_value,
+            exam_date=stats.exam_date,
+            max_marks=stats.max_marks,
             students=student_data,
             total_students=len(students),
-            average_marks=Decimal(str(average)).quantize(Decimal("0.01")) if average else None,
-            highest_marks=highest,
-            lowest_marks=lowest,
+            average_marks=stats.avg.quantize(Decimal("0.01")) if stats.avg is not None else None,
+            highest_marks=stats.highest,
+            lowest_marks=stats.lowest,
         )
 
     def get_exam_names(self, project_id: int) -> list[str]:
@@ -540,15 +758,16 @@ class ExamService:
         subject: str | None = None,
         month: int | None = None,
         year: int | None = None,
-    ) -> bytes:
+    ) -> BytesIO:
         """Generate Excel template for exam upload.
 
         Creates a properly formatted template with all required columns.
-        When class_section is provided, pre-fills student data.
+        When class_section is provided, pre-fills student data. Returns the
+        saved workbook buffer rewound to the start, ready to stream.
         """
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Exam Records"
+        # Write-only workbook: rows are streamed as lists of styled cells
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Exam Records")
 
         # Default to current month/year
         today = date.today()
@@ -556,19 +775,14 @@ class ExamService:
         year = year or today.year
         month_name = calendar.month_name[month]
 
-        # Styles
-        title_font = Font(bold=True, size=14)
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        subheader_fill = PatternFill(start_color="8FAADC", end_color="8FAADC", fill_type="solid")
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        center_align = Alignment(horizontal='center', vertical='center')
-        left_align = Alignment(horizontal='left', vertical='center')
+        def bordered(value) -> WriteOnlyCell:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.border = _THIN_BORDER
+            return cell
+
+        # Column widths (must be set before the first row is written)
+        for col_idx, width in enumerate(_TEMPLATE_COLUMN_WIDTHS, start=1):
+            ws.column_dimensions[_COLUMN_LETTERS[col_idx]].width = width
 
         # Title row
         title_text = f"Exam Records - {month_name} {year}"
@@ -576,12 +790,13 @@ class ExamService:
             title_text = f"{class_section} - {title_text}"
         if subject:
             title_text += f" - {subject}"
-        
-        ws.merge_cells('A1:I1')
-        title_cell = ws.cell(row=1, column=1, value=title_text)
-        title_cell.font = title_font
-        title_cell.alignment = center_align
-        title_cell.fill = PatternFill(start_color="B4C6E7", end_color="B4C6E7", fill_type="solid")
+
+        title_cell = WriteOnlyCell(ws, value=title_text)
+        title_cell.font = _TITLE_FONT
+        title_cell.alignment = _CENTER_ALIGN
+        title_cell.fill = _TITLE_FILL
+        ws.append([title_cell])
+        ws.merged_cells.add(f"A1:{_COLUMN_LETTERS[len(_TEMPLATE_COLUMN_WIDTHS)]}1")
 
         # Headers - always include ALL required columns
         headers = [
@@ -596,61 +811,46 @@ class ExamService:
             "Remarks"
         ]
 
-        for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=2, column=col_idx, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = thin_border
-            cell.alignment = center_align
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = _HEADER_FONT
+            cell.fill = _HEADER_FILL
+            cell.border = _THIN_BORDER
+            cell.alignment = _CENTER_ALIGN
+            header_cells.append(cell)
+        ws.append(header_cells)
 
         # Get students if class is specified
-        start_row = 3
         if class_section:
-            class_name, section = self._parse_class_section(class_section)
+            class_name, section = _parse_class_section(class_section)
             students = self._get_students_by_class(project_id, class_name, section)
 
             default_exam_name = f"{month_name} {year} Exam"
             default_exam_date = f"{year}-{month:02d}-01"
             default_subject = subject if subject else ""
 
-            for row_idx, student in enumerate(students, start=start_row):
+            for student in students:
                 grade_str = f"{student.class_name}-{student.section}" if student.section else student.class_name
-                
-                ws.cell(row=row_idx, column=1, value=student.student_name).border = thin_border
-                ws.cell(row=row_idx, column=2, value=grade_str).border = thin_border
-                ws.cell(row=row_idx, column=3, value=default_exam_name).border = thin_border
-                ws.cell(row=row_idx, column=4, value=default_subject).border = thin_border
-                ws.cell(row=row_idx, column=5, value=default_exam_date).border = thin_border
-                ws.cell(row=row_idx, column=6, value=100).border = thin_border  # Default max marks
-                ws.cell(row=row_idx, column=7, value="").border = thin_border  # Marks obtained - to be filled
-                ws.cell(row=row_idx, column=8, value="").border = thin_border  # Grade - auto calculated
-                ws.cell(row=row_idx, column=9, value="").border = thin_border  # Remarks
+                ws.append([
+                    bordered(student.student_name),
+                    bordered(grade_str),
+                    bordered(default_exam_name),
+                    bordered(default_subject),
+                    bordered(default_exam_date),
+                    bordered(100),  # Default max marks
+                    bordered(""),  # Marks obtained - to be filled
+                    bordered(""),  # Grade - auto calculated
+                    bordered(""),  # Remarks
+                ])
         else:
             # Add sample rows
             sample_data = [
                 ["John Doe", "10-A", f"{month_name} {year} Exam", "Mathematics", f"{year}-{month:02d}-15", 100, 85, "", "Good"],
                 ["Jane Smith", "10-A", f"{month_name} {year} Exam", "Mathematics", f"{year}-{month:02d}-15", 100, 92, "", "Excellent"],
             ]
-            for row_offset, row_data in enumerate(sample_data):
-                row_idx = start_row + row_offset
-                for col_idx, value in enumerate(row_data, start=1):
-                    cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                    cell.border = thin_border
-
-        # Column widths
-        column_widths = {
-            'A': 25,  # Student Name
-            'B': 10,  # Grade
-            'C': 25,  # Exam Name
-            'D': 15,  # Subject
-            'E': 12,  # Exam Date
-            'F': 12,  # Max Marks
-            'G': 15,  # Marks Obtained
-            'H': 12,  # Grade (Auto)
-            'I': 20,  # Remarks
-        }
-        for col, width in column_widths.items():
-            ws.column_dimensions[col].width = width
+            for row_data in sample_data:
+                ws.append([bordered(value) for value in row_data])
 
         # Add instructions sheet
         instructions_ws = wb.create_sheet("Instructions")
@@ -677,23 +877,22 @@ class ExamService:
         ]
         
         for row_idx, (col1, col2) in enumerate(instructions, start=1):
-            cell1 = instructions_ws.cell(row=row_idx, column=1, value=col1)
-            cell2 = instructions_ws.cell(row=row_idx, column=2, value=col2)
+            cell1 = WriteOnlyCell(instructions_ws, value=col1)
             if row_idx == 1:
-                cell1.font = Font(bold=True, size=14)
+                cell1.font = _TITLE_FONT
             elif col1 and col1.endswith(":"):
-                cell1.font = Font(bold=True)
+                cell1.font = _BOLD_FONT
+            instructions_ws.append([cell1, col2])
 
         # List all valid subjects
-        subject_start_row = len(instructions) + 1
         for idx, subj in enumerate(SUBJECTS):
-            instructions_ws.cell(row=subject_start_row + idx, column=1, value=f"{idx + 1}.")
-            instructions_ws.cell(row=subject_start_row + idx, column=2, value=subj)
+            instructions_ws.append([f"{idx + 1}.", subj])
 
+        # Hand back the buffer itself; getvalue() would copy the whole file
         output = BytesIO()
         wb.save(output)
         output.seek(0)
-        return output.getvalue()
+        return output
 
     # ==========================================
     # Excel Upload Processing
@@ -709,29 +908,45 @@ class ExamService:
         logger.info(f"[EXAM UPLOAD] Starting - project_id={project_id}, file_size={len(file_content)} bytes")
 
         try:
-            wb = load_workbook(BytesIO(file_content), data_only=True)
+            # Read-only: rows are streamed from the XML instead of building the cell tree
+            wb = load_workbook(BytesIO(file_content), data_only=True, read_only=True)
             ws = wb.active
         except Exception as e:
             logger.error(f"[EXAM UPLOAD] Failed to load Excel: {str(e)}")
             raise ValidationError(f"Invalid Excel file: {str(e)}")
 
         errors: list[ExamUploadError] = []
+
+        def add_error(**fields) -> None:
+            # Past the cap, failures are still counted but not itemised
+            if len(errors) < _MAX_UPLOAD_ERRORS:
+                errors.append(ExamUploadError(**fields))
+
+        valid_rows: list[tuple] = []
+        # Marks repeat heavily across rows ("100", "75", ...); parse each string once
+        decimal_cache: dict[str, Decimal] = {}
+        date_cache: dict[str, date] = {}
+        today = date.today()
         successful_rows = 0
         failed_rows = 0
         skipped_rows = 0
 
-        # Parse headers
-        headers = [str(cell.value).strip().lower() if cell.value else "" for cell in ws[1]]
+        # Parse headers (read before the row stream starts)
+        header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        headers = [str(value).strip().lower() if value else "" for value in header_row]
         logger.info(f"[EXAM UPLOAD] Headers: {headers}")
 
         # Get all students in project indexed by name (case-insensitive)
+        # Streamed in batches as plain (id, name, class, section) tuples;
+        # the row loop does one dict lookup and never touches ORM attributes
         students_result = self.db.execute(
-            select(Student).where(Student.project_id == project_id)
+            select(Student.id, Student.student_name, Student.class_name, Student.section)
+            .where(Student.project_id == project_id)
+            .execution_options(yield_per=1000)
         )
-        students_by_name: dict[str, Student] = {}
-        for s in students_result.scalars().all():
-            key = s.student_name.lower().strip()
-            students_by_name[key] = s
+        students_by_name: dict[str, tuple[int, str, str, str | None]] = {}
+        for s in students_result.tuples():
+            students_by_name[s[1].strip().lower()] = s
         logger.info(f"[EXAM UPLOAD] Found {len(students_by_name)} students in database")
 
         # Map header names to column indices
@@ -748,50 +963,56 @@ class ExamService:
         }
 
         for idx, header in enumerate(headers):
-            if "student" in header and "name" in header:
-                col_map["student_name"] = idx
-            elif "grade" in header and "class" in header:
-                col_map["grade"] = idx
-            elif header == "grade":
-                if col_map["grade"] is None:
-                    col_map["grade"] = idx
-                else:
-                    col_map["grade_col"] = idx
-            elif "exam" in header and "name" in header:
-                col_map["exam_name"] = idx
-            elif "subject" in header:
-                col_map["subject"] = idx
-            elif "date" in header:
-                col_map["exam_date"] = idx
-            elif "max" in header:
-                col_map["max_marks"] = idx
-            elif "obtained" in header or "marks" in header:
-                if col_map["max_marks"] is not None and col_map["marks_obtained"] is None:
-                    col_map["marks_obtained"] = idx
-                elif col_map["marks_obtained"] is None:
-                    col_map["marks_obtained"] = idx
-            elif "remark" in header:
-                col_map["remarks"] = idx
+            field = _HEADER_ALIASES.get(header) or _match_header(header)
+            if field is None:
+                continue
+            # A second plain "Grade" column holds the exam grade, not the class
+            if field == "grade" and header == "grade" and col_map["grade"] is not None:
+                field = "grade_col"
+            # First marks column wins
+            if field == "marks_obtained" and col_map["marks_obtained"] is not None:
+                continue
+            col_map[field] = idx
 
         logger.info(f"[EXAM UPLOAD] Column mapping: {col_map}")
 
-        # Process rows
-        for row_num, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+        # Rows are read to the header width (at least one column, so an empty
+        # header row can't fall back to full-width reads) and padded one cell
+        # past it; unmapped fields point at that always-empty cell.
+        read_width = max(len(headers), 1)
+        # Row index of each field in col_map order. Bound once as an
+        # itemgetter, the per-row pick is a single C call.
+        pick_fields = itemgetter(*[read_width if idx is None else idx for idx in col_map.values()])
+
+        # Process rows, writing valid ones in fixed-size chunks so memory stays
+        # flat however long the sheet is
+        for row_num, row in enumerate(
+            ws.iter_rows(min_row=2, max_col=read_width, values_only=True), start=2
+        ):
+            if len(valid_rows) >= _UPSERT_BATCH_SIZE:
+                self._write_upload_rows(project_id, valid_rows, upload_id)
+                valid_rows.clear()
+
             if not any(row):
                 skipped_rows += 1
                 continue
+            # Read-only rows can stop at the last non-empty cell
+            row = row + (None,) * (read_width + 1 - len(row))
 
             try:
                 # Extract values
-                student_name = str(row[col_map["student_name"]]).strip() if col_map["student_name"] is not None and row[col_map["student_name"]] else None
-                grade_class = str(row[col_map["grade"]]).strip() if col_map["grade"] is not None and row[col_map["grade"]] else None
-                exam_name = str(row[col_map["exam_name"]]).strip() if col_map["exam_name"] is not None and row[col_map["exam_name"]] else None
-                subject = str(row[col_map["subject"]]).strip() if col_map["subject"] is not None and row[col_map["subject"]] else None
-                exam_date_str = str(row[col_map["exam_date"]]).strip() if col_map["exam_date"] is not None and row[col_map["exam_date"]] else None
-                max_marks_str = str(row[col_map["max_marks"]]).strip() if col_map["max_marks"] is not None and row[col_map["max_marks"]] else None
-                marks_str = str(row[col_map["marks_obtained"]]).strip() if col_map["marks_obtained"] is not None and row[col_map["marks_obtained"]] else None
-                grade_value = str(row[col_map["grade_col"]]).strip() if col_map["grade_col"] is not None and row[col_map["grade_col"]] else None
-                remarks = str(row[col_map["remarks"]]).strip() if col_map["remarks"] is not None and row[col_map["remarks"]] else None
+                values = pick_fields(row)
+                (
+                    student_name,
+                    grade_class,
+                    exam_name,
+                    subject,
+                    exam_date_str,
+                    max_marks_str,
+                    marks_str,
+                    grade_value,
+                    remarks,
+                ) = [str(value).strip() if value else None for value in values]
 
                 if not student_name:
                     skipped_rows += 1
@@ -801,131 +1022,122 @@ class ExamService:
                 student_key = student_name.lower()
                 student = students_by_name.get(student_key)
                 if not student:
-                    errors.append(ExamUploadError(
+                    add_error(
                         row=row_num,
                         student_name=student_name,
                         message=f"Student '{student_name}' not found in system",
-                    ))
+                    )
                     failed_rows += 1
                     continue
 
                 # Validate required fields
                 if not exam_name:
-                    errors.append(ExamUploadError(
+                    add_error(
                         row=row_num,
                         student_name=student_name,
                         column="Exam Name",
                         message="Exam name is required",
-                    ))
+                    )
                     failed_rows += 1
                     continue
 
                 if not subject:
-                    errors.append(ExamUploadError(
+                    add_error(
                         row=row_num,
                         student_name=student_name,
                         column="Subject",
                         message="Subject is required",
-                    ))
+                    )
                     failed_rows += 1
                     continue
 
-                # Parse exam date
-                exam_date = None
-                if exam_date_str:
-                    try:
-                        if "-" in exam_date_str:
-                            parts = exam_date_str.split("-")
-                            exam_date = date(int(parts[0]), int(parts[1]), int(parts[2].split()[0]))
-                        else:
-                            exam_date = date.today()
-                    except Exception:
-                        exam_date = date.today()
+                # Parse exam date. Date-formatted cells are already datetimes and
+                # skip the string round-trip; text dates repeat, so parse each once.
+                exam_date_cell = values[4]
+                if isinstance(exam_date_cell, datetime):
+                    exam_date = exam_date_cell.date()
+                elif isinstance(exam_date_cell, date):
+                    exam_date = exam_date_cell
+                elif exam_date_str:
+                    exam_date = date_cache.get(exam_date_str)
+                    if exam_date is None:
+                        exam_date = date_cache[exam_date_str] = _parse_exam_date(exam_date_str, today)
                 else:
-                    exam_date = date.today()
+                    exam_date = today
 
                 # Parse max marks
-                try:
-                    max_marks = Decimal(max_marks_str) if max_marks_str else Decimal("100")
-                except Exception:
-                    max_marks = Decimal("100")
+                max_marks = decimal_cache.get(max_marks_str) if max_marks_str else _DEFAULT_MAX_MARKS
+                if max_marks is None:
+                    try:
+                        max_marks = decimal_cache[max_marks_str] = Decimal(max_marks_str)
+                    except Exception:
+                        max_marks = _DEFAULT_MAX_MARKS
 
                 # Parse marks obtained
                 if not marks_str:
-                    errors.append(ExamUploadError(
+                    add_error(
                         row=row_num,
                         student_name=student_name,
                         column="Marks Obtained",
                         message="Marks obtained is required",
-                    ))
+                    )
                     failed_rows += 1
                     continue
 
-                try:
-                    marks_obtained = Decimal(marks_str)
-                except Exception:
-                    errors.append(ExamUploadError(
+                marks_obtained = decimal_cache.get(marks_str)
+                if marks_obtained is None:
+                    try:
+                        marks_obtained = decimal_cache[marks_str] = Decimal(marks_str)
+                    except Exception:
+                        marks_obtained = None
+                if marks_obtained is None:
+                    add_error(
                         row=row_num,
                         student_name=student_name,
                         column="Marks Obtained",
                         message=f"Invalid marks value: '{marks_str}'",
-                    ))
+                    )
                     failed_rows += 1
                     continue
 
                 # Validate marks
                 if marks_obtained > max_marks:
-                    errors.append(ExamUploadError(
+                    add_error(
                         row=row_num,
                         student_name=student_name,
                         message=f"Marks obtained ({marks_obtained}) exceeds max marks ({max_marks})",
-                    ))
+                    )
                     failed_rows += 1
                     continue
 
-                # Calculate grade if not provided
-                grade = grade_value if grade_value and grade_value.lower() != "none" else None
-                if not grade:
-                    grade = self._calculate_grade(marks_obtained, max_marks)
-
-                # Check for existing record and update or create
-                # Uniqueness includes exam_date, so same exam type on different dates creates new records
-                existing = self._get_existing_record(
-                    project_id, student.id, exam_name, subject, exam_date
-                )
-
-                if existing:
-                    existing.marks_obtained = marks_obtained
-                    existing.max_marks = max_marks
-                    existing.exam_date = exam_date
-                    existing.grade = grade
-                    existing.remarks = remarks if remarks and remarks.lower() != "none" else None
-                    if upload_id:
-                        existing.upload_id = upload_id
-                else:
-                    record = ExamRecord(
-                        project_id=project_id,
-                        student_id=student.id,
-                        exam_name=exam_name,
-                        subject=subject,
-                        exam_date=exam_date,
-                        max_marks=max_marks,
-                        marks_obtained=marks_obtained,
-                        grade=grade,
-                        remarks=remarks if remarks and remarks.lower() != "none" else None,
-                        upload_id=upload_id,
-                    )
-                    self.db.add(record)
-
+                # Missing grades are calculated per chunk, just before the write
+                grade = _none_if_placeholder(grade_value)
+
+                valid_rows.append((
+                    student[0],
+                    exam_name,
+                    subject,
+                    exam_date,
+                    max_marks,
+                    marks_obtained,
+                    grade,
+                    _none_if_placeholder(remarks),
+                ))
                 successful_rows += 1
 
             except Exception as e:
-                errors.append(ExamUploadError(
+                add_error(
                     row=row_num,
                     message=f"Error processing row: {str(e)}",
-                ))
+                )
                 failed_rows += 1
 
+        wb.close()
+
+        # Write whatever is left of the last chunk
+        if valid_rows:
+            self._write_upload_rows(project_id, valid_rows, upload_id)
+
         self.db.flush()
 
         total = successful_rows + failed_rows + skipped_rows
@@ -937,6 +1149,7 @@ class ExamService:
             failed_rows=failed_rows,
             skipped_rows=skipped_rows,
             errors=errors,
+            errors_truncated=failed_rows > len(errors),
             message=f"Processed {successful_rows} exam records successfully.",
         )
 
@@ -944,18 +1157,75 @@ class ExamService:
     # Helper Methods
     # ==========================================
 
-    def _parse_class_section(self, class_section: str) -> tuple[str, str | None]:
-        """Parse class-section string like '3-A' into (class_name, section)."""
-        if "-" in class_section:
-            parts = class_section.rsplit("-", 1)
-            return parts[0], parts[1]
-        return class_section, None
+    def _write_upload_rows(
+        self, project_id: int, valid_rows: list[tuple], upload_id: int | None
+    ) -> None:
+        """Grade and upsert one chunk of validated upload rows.
+
+        Rows are (student_id, exam_name, subject, exam_date, max_marks,
+        marks_obtained, grade, remarks) tuples. Existing records are updated,
+        the rest created. Uniqueness includes exam_date, so same exam type on
+        different dates creates new records.
+        """
+        # Fill in missing grades (tuple index 6) in one batch
+        ungraded = [i for i, row in enumerate(valid_rows) if not row[6]]
+        if ungraded:
+            grades = self._calculate_grades(
+                [valid_rows[i][5] for i in ungraded],
+                [valid_rows[i][4] for i in ungraded],
+            )
+            for i, grade in zip(ungraded, grades, strict=True):
+                valid_rows[i] = valid_rows[i][:6] + (grade,) + valid_rows[i][7:]
+
+        # A later row for the same key overrides the earlier one, and
+        # ON CONFLICT can't touch one row twice within a statement.
+        # Across chunks, the later chunk's upsert overwrites the same way.
+        upsert_rows: dict[tuple, dict] = {}
+        for student_id, exam_name, subject, exam_date, max_marks, marks_obtained, grade, remarks in valid_rows:
+            upsert_rows[(student_id, exam_name, subject, exam_date)] = {
+                "project_id": project_id,
+                "student_id": student_id,
+                "exam_name": exam_name,
+                "subject": subject,
+                "exam_date": exam_date,
+                "max_marks": max_marks,
+                "marks_obtained": marks_obtained,
+                "grade": grade,
+                "remarks": remarks,
+                "upload_id": upload_id,
+            }
+        self._upsert_records(list(upsert_rows.values()))
+
+    def _upsert_records(self, rows: list[dict]) -> None:
+        """Insert exam records, updating any that already exist.
+
+        Conflicts are matched on uq_exam_student_subject_date. An existing
+        record keeps its upload_id when the incoming row has none.
+        """
+        table = ExamRecord.__table__
+        # One statement, run as executemany per batch: it compiles once and the
+        # driver packs each batch into multi-row VALUES pages
+        stmt = pg_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_exam_student_subject_date",
+            set_={
+                "marks_obtained": stmt.excluded.marks_obtained,
+                "max_marks": stmt.excluded.max_marks,
+                "grade": stmt.excluded.grade,
+                "remarks": stmt.excluded.remarks,
+                "upload_id": func.coalesce(stmt.excluded.upload_id, table.c.upload_id),
+                "updated_at": func.now(),
+            },
+        )
+        for start in range(0, len(rows), _UPSERT_BATCH_SIZE):
+            self.db.execute(stmt, rows[start:start + _UPSERT_BATCH_SIZE])
 
     def _get_students_by_class(
         self, project_id: int, class_name: str, section: str | None = None
     ) -> list[Student]:
         """Get all students in a class, optionally filtered by section."""
-        query = select(Student).where(
+        # The student's own attendance/exam collections are never read here
+        query = select(Student).options(lazyload("*")).where(
             Student.project_id == project_id,
             Student.class_name == class_name,
         )
@@ -1,7 +1,9 @@
 """Menu Screen service for sidebar menu management."""
 
-from sqlalchemy import delete, select
-from sqlalchemy.orm import Session, selectinload
+import time
+
+from sqlalchemy import delete, event, exists, insert, select
+from sqlalchemy.orm import Session, lazyload, selectinload
 
 from app.core.exceptions import NotFoundError, ValidationError
 from app.models.menu_screen import MenuScreen, MenuScreenPermission, ProjectMenuScreen
@@ -19,6 +21,46 @@ from app.schemas.menu_screen import (
 )
 from app.schemas.rbac import PermissionResponse
 
+# list_menu_screens() result, shared by every request in this process:
+# {"all": (monotonic time built, responses)}. Menus change rarely; each
+# write clears it once its transaction commits, and other workers pick
+# changes up within the TTL. Callers only ever get deep copies.
+_MENU_CACHE_TTL_SECONDS = 60.0
+_menu_cache: dict[str, tuple[float, list[MenuScreenWithPermissions]]] = {}
+
+
+def _clear_menu_cache(session: Session) -> None:
+    """after_commit listener that drops the cached menu list."""
+    _menu_cache.clear()
+
+
+def _invalidate_menu_cache_on_commit(db: Session) -> None:
+    """Clear the menu cache after db's current transaction commits.
+
+    Clearing before the commit would let a concurrent request reload and
+    cache the pre-commit menus for a full TTL.
+    """
+    event.listen(db, "after_commit", _clear_menu_cache, once=True)
+
+
+# Menu -> permission mappings -> permission, without the selectin cascades the
+# response never reads (menu allocations, every permission's role grants)
+_MENU_PERMISSION_LOADS = (
+    selectinload(MenuScreen.permission_mappings)
+    .selectinload(MenuScreenPermission.permission)
+    .options(lazyload("*")),
+    lazyload(MenuScreen.project_allocations),
+)
+
+
+def _permission_response(permission: Permission) -> PermissionResponse:
+    """Build a PermissionResponse from trusted DB values, skipping validation."""
+    return PermissionResponse.model_construct(
+        id=permission.id,
+        permission_key=permission.permission_key,
+        description=permission.description,
+    )
+
 
 class MenuScreenService:
     """Service for managing menu screens and project allocations."""
@@ -28,36 +70,32 @@ class MenuScreenService:
 
     # Menu Screen CRUD
     def list_menu_screens(self) -> list[MenuScreenWithPermissions]:
-        """List all menu screens with their permissions."""
+        """List all menu screens with their permissions.
+
+        Served from a short process-level cache; menu writes clear it.
+        """
+        cached = _menu_cache.get("all")
+        if cached is not None and time.monotonic() - cached[0] < _MENU_CACHE_TTL_SECONDS:
+            return [menu.model_copy(deep=True) for menu in cached[1]]
+
         result = self.db.execute(
             select(MenuScreen)
-            .options(selectinload(MenuScreen.permission_mappings).selectinload(MenuScreenPermission.permission))
+            .options(*_MENU_PERMISSION_LOADS)
             .order_by(MenuScreen.display_order)
         )
         menus = result.scalars().all()
-        
-        return [
-            MenuScreenWithPermissions(
-                id=menu.id,
-                name=menu.name,
-                route=menu.route,
-                display_order=menu.display_order,
-                description=menu.description,
-                created_at=menu.created_at,
-                updated_at=menu.updated_at,
-                permissions=[
-                    PermissionResponse.model_validate(mp.permission)
-                    for mp in menu.permission_mappings
-                ],
-            )
-            for menu in menus
-        ]
+
+        # Menus commonly share permissions; build each response once
+        permission_cache: dict[int, PermissionResponse] = {}
+        responses = [self._menu_to_response(menu, permission_cache) for menu in menus]
+        _menu_cache["all"] = (time.monotonic(), responses)
+        return [menu.model_copy(deep=True) for menu in responses]
 
     def get_menu_screen(self, menu_id: int) -> MenuScreen:
         """Get a menu screen by ID."""
         result = self.db.execute(
             select(MenuScreen)
-            .options(selectinload(MenuScreen.permission_mappings).selectinload(MenuScreenPermission.permission))
+            .options(*_MENU_PERMISSION_LOADS)
             .where(MenuScreen.id == menu_id)
         )
         menu = result.scalar_one_or_none()
@@ -83,20 +121,11 @@ class MenuScreenService:
         self.db.add(menu)
         self.db.flush()
 
+        _invalidate_menu_cache_on_commit(self.db)
+
         # Link permissions
-        permissions = []
-        for perm_key in request.permission_keys:
-            perm_result = self.db.execute(
-                select(Permission).where(Permission.permission_key == perm_key)
-            )
-            perm = perm_result.scalar_one_or_none()
-            if perm:
-                mapping = MenuScreenPermission(
-                    menu_screen_id=menu.id,
-                    permission_id=perm.id,
-                )
-                self.db.add(mapping)
-                permissions.append(PermissionResponse.model_validate(perm))
+        perms = self._link_permissions(menu.id, request.permission_keys)
+        permissions = [_permission_response(perm) for perm in perms]
 
         self.db.flush()
         self.db.refresh(menu)
@@ -119,6 +148,7 @@ class MenuScreenService:
     ) -> MenuScreenWithPermissions:
         """Update a menu screen (super admin only)."""
         menu = self.get_menu_screen(menu_id)
+        _invalidate_menu_cache_on_commit(self.db)
 
         # Update fields
         if request.name is not None:
@@ -149,17 +179,7 @@ class MenuScreenService:
                 )
             )
             # Add new mappings
-            for perm_key in request.permission_keys:
-                perm_result = self.db.execute(
-                    select(Permission).where(Permission.permission_key == perm_key)
-                )
-                perm = perm_result.scalar_one_or_none()
-                if perm:
-                    mapping = MenuScreenPermission(
-                        menu_screen_id=menu.id,
-                        permission_id=perm.id,
-                    )
-                    self.db.add(mapping)
+            self._link_permissions(menu.id, request.permission_keys)
 
         self.db.flush()
         self.db.refresh(menu)
@@ -170,6 +190,7 @@ class MenuScreenService:
     def delete_menu_screen(self, menu_id: int) -> None:
         """Delete a menu screen (super admin only)."""
         menu = self.get_menu_screen(menu_id)
+        _invalidate_menu_cache_on_commit(self.db)
         self.db.delete(menu)
         self.db.flush()
 
@@ -187,36 +208,19 @@ class MenuScreenService:
         result = self.db.execute(
             select(ProjectMenuScreen)
             .options(
-                selectinload(ProjectMenuScreen.menu_screen)
-                .selectinload(MenuScreen.permission_mappings)
-                .selectinload(MenuScreenPermission.permission)
+                selectinload(ProjectMenuScreen.menu_screen).options(*_MENU_PERMISSION_LOADS)
             )
+            .join(MenuScreen, MenuScreen.id == ProjectMenuScreen.menu_screen_id)
             .where(ProjectMenuScreen.project_id == project_id)
-            .order_by(ProjectMenuScreen.menu_screen_id)
+            .order_by(MenuScreen.display_order, MenuScreen.id)
         )
         allocations = result.scalars().all()
 
-        allocated_menus = []
-        for alloc in allocations:
-            menu = alloc.menu_screen
-            allocated_menus.append(
-                MenuScreenWithPermissions(
-                    id=menu.id,
-                    name=menu.name,
-                    route=menu.route,
-                    display_order=menu.display_order,
-                    description=menu.description,
-                    created_at=menu.created_at,
-                    updated_at=menu.updated_at,
-                    permissions=[
-                        PermissionResponse.model_validate(mp.permission)
-                        for mp in menu.permission_mappings
-                    ],
-                )
-            )
-
-        # Sort by display_order
-        allocated_menus.sort(key=lambda m: m.display_order)
+        permission_cache: dict[int, PermissionResponse] = {}
+        allocated_menus = [
+            self._menu_to_response(alloc.menu_screen, permission_cache)
+            for alloc in allocations
+        ]
 
         return ProjectMenuAllocationResponse(
             project_id=project_id,
@@ -260,18 +264,15 @@ class MenuScreenService:
         if menus_to_remove:
             self._remove_menu_allocations(project_id, list(menus_to_remove))
 
-        # Add new allocations
-        for menu_id in menus_to_add:
-            # Verify menu exists
-            menu_exists = self.db.execute(
-                select(MenuScreen.id).where(MenuScreen.id == menu_id)
-            ).scalar_one_or_none()
-            if menu_exists:
-                allocation = ProjectMenuScreen(
-                    project_id=project_id,
-                    menu_screen_id=menu_id,
-                )
-                self.db.add(allocation)
+        # Add new allocations (unknown menu ids are skipped)
+        if menus_to_add:
+            existing_menu_ids = self.db.execute(
+                select(MenuScreen.id).where(MenuScreen.id.in_(menus_to_add))
+            ).scalars().all()
+            self.db.add_all(
+                ProjectMenuScreen(project_id=project_id, menu_screen_id=menu_id)
+                for menu_id in existing_menu_ids
+            )
 
         self.db.flush()
 
@@ -324,28 +325,58 @@ class MenuScreenService:
         
         Only permissions from allocated menus are available.
         """
-        # Get all menus with permissions
-        all_menus = self.list_menu_screens()
+        # Query 1: every menu with its allocation flag for this project
+        is_allocated = (
+            exists()
+            .where(
+                ProjectMenuScreen.menu_screen_id == MenuScreen.id,
+                ProjectMenuScreen.project_id == project_id,
+            )
+            .label("is_allocated")
+        )
+        all_menus = self.db.execute(
+            select(MenuScreen.id, MenuScreen.name, is_allocated)
+            .order_by(MenuScreen.display_order)
+        ).all()
 
-        # Get allocated menu IDs
-        allocated_result = self.db.execute(
-            select(ProjectMenuScreen.menu_screen_id)
+        # Query 2: permissions of the allocated menus only, grouped by menu
+        perm_result = self.db.execute(
+            select(
+                MenuScreenPermission.menu_screen_id,
+                Permission.id,
+                Permission.permission_key,
+                Permission.description,
+            )
+            .join(Permission, Permission.id == MenuScreenPermission.permission_id)
+            .join(
+                ProjectMenuScreen,
+                ProjectMenuScreen.menu_screen_id == MenuScreenPermission.menu_screen_id,
+            )
             .where(ProjectMenuScreen.project_id == project_id)
+            .order_by(MenuScreenPermission.id)
         )
-        allocated_menu_ids = set(row[0] for row in allocated_result)
+        permissions_by_menu: dict[int, list[PermissionResponse]] = {}
+        permission_cache: dict[int, PermissionResponse] = {}
+        for menu_id, perm_id, perm_key, perm_description in perm_result:
+            perm = permission_cache.get(perm_id)
+            if perm is None:
+                perm = permission_cache[perm_id] = PermissionResponse.model_construct(
+                    id=perm_id,
+                    permission_key=perm_key,
+                    description=perm_description,
+                )
+            permissions_by_menu.setdefault(menu_id, []).append(perm)
 
         # Build menu groups
-        menu_groups = []
-        for menu in all_menus:
-            is_allocated = menu.id in allocated_menu_ids
-            menu_groups.append(
-                MenuPermissionGroup(
-                    menu_id=menu.id,
-                    menu_name=menu.name,
-                    is_allocated=is_allocated,
-                    permissions=menu.permissions if is_allocated else [],
-                )
+        menu_groups = [
+            MenuPermissionGroup(
+                menu_id=menu_id,
+                menu_name=menu_name,
+                is_allocated=allocated,
+                permissions=permissions_by_menu.get(menu_id, []),
             )
+            for menu_id, menu_name, allocated in all_menus
+        ]
 
         return AvailablePermissionsResponse(
             project_id=project_id,
@@ -374,8 +405,50 @@ class MenuScreenService:
         )
         return set(row[0] for row in perm_result)
 
-    def _menu_to_response(self, menu: MenuScreen) -> MenuScreenWithPermissions:
-        """Convert a menu model to response with permissions."""
+    def _get_permissions_by_key(self, permission_keys: list[str]) -> dict[str, Permission]:
+        """Resolve permission keys in one query; unknown keys are left out."""
+        if not permission_keys:
+            return {}
+        result = self.db.execute(
+            select(Permission)
+            .options(lazyload("*"))
+            .where(Permission.permission_key.in_(permission_keys))
+        )
+        return {perm.permission_key: perm for perm in result.scalars()}
+
+    def _link_permissions(self, menu_id: int, permission_keys: list[str]) -> list[Permission]:
+        """Map a menu to the given permission keys with one batched INSERT.
+
+        Returns the linked permissions in key order; unknown keys are skipped.
+        """
+        perms_by_key = self._get_permissions_by_key(permission_keys)
+        perms = [perms_by_key[key] for key in permission_keys if key in perms_by_key]
+        if perms:
+            self.db.execute(
+                insert(MenuScreenPermission),
+                [{"menu_screen_id": menu_id, "permission_id": perm.id} for perm in perms],
+            )
+        return perms
+
+    def _menu_to_response(
+        self,
+        menu: MenuScreen,
+        permission_cache: dict[int, PermissionResponse] | None = None,
+    ) -> MenuScreenWithPermissions:
+        """Convert a menu model to response with permissions.
+
+        Pass the same permission_cache across menus to share one response
+        per permission.
+        """
+        if permission_cache is None:
+            permission_cache = {}
+        permissions = []
+        for mp in menu.permission_mappings:
+            perm = permission_cache.get(mp.permission_id)
+            if perm is None:
+                perm = permission_cache[mp.permission_id] = _permission_response(mp.permission)
+            permissions.append(perm)
+
         return MenuScreenWithPermissions(
             id=menu.id,
             name=menu.name,
@@ -384,8 +457,5 @@ class MenuScreenService:
             description=menu.description,
             created_at=menu.created_at,
             updated_at=menu.updated_at,
-            permissions=[
-                PermissionResponse.model_validate(mp.permission)
-                for mp in menu.permission_mappings
-            ],
+            permissions=permissions,
         )
@@ -1,11 +1,11 @@
 """Notification service."""
 
-from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select, update
-from sqlalchemy.orm import Session
+from sqlalchemy import BigInteger, any_, bindparam, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session, raiseload
 
 from app.core.exceptions import NotFoundError
 from app.models.notification import Notification
@@ -44,22 +44,32 @@ class NotificationService:
 
         return NotificationResponse.model_validate(notification)
 
-    def get_notification(
+    def create_notifications_bulk(
         self,
-        notification_id: UUID,
-        user_id: UUID,
-    ) -> Notification:
-        """Get notification by ID (must belong to user)."""
-        result = self.db.execute(
-            select(Notification).where(
-                Notification.id == notification_id,
-                Notification.user_id == user_id,
-            )
+        project_id: UUID,
+        requests: list[NotificationCreate],
+    ) -> None:
+        """Create notifications in one batched INSERT.
+
+        For fire-and-forget callers: nothing is refreshed or returned.
+        """
+        if not requests:
+            return
+        self.db.execute(
+            insert(Notification),
+            [
+                {
+                    "project_id": project_id,
+                    "user_id": request.user_id,
+                    "title": request.title,
+                    "message": request.message,
+                    "notification_type": request.notification_type,
+                    "action_url": request.action_url,
+                    "action_data": request.action_data,
+                }
+                for request in requests
+            ],
         )
-        notification = result.scalar_one_or_none()
-        if not notification:
-            raise NotFoundError("Notification", str(notification_id))
-        return notification
 
     def list_notifications(
         self,
@@ -70,35 +80,41 @@ class NotificationService:
         page_size: int = 20,
     ) -> tuple[list[NotificationResponse], int]:
         """List notifications for a user."""
-        query = select(Notification).where(
+        conditions = [
             Notification.project_id == project_id,
             Notification.user_id == user_id,
-        )
+        ]
 
         if filters:
             if filters.is_read is not None:
-                query = query.where(Notification.is_read == filters.is_read)
+                conditions.append(Notification.is_read == filters.is_read)
             if filters.notification_type:
-                query = query.where(Notification.notification_type == filters.notification_type)
+                conditions.append(Notification.notification_type == filters.notification_type)
 
-        # Count total
-        count_result = self.db.execute(
-            select(func.count()).select_from(query.subquery())
-        )
-        total = count_result.scalar() or 0
-
-        # Apply pagination and ordering
-        query = (
-            query
+        # The page and the total come back together: COUNT(*) OVER () is
+        # evaluated before OFFSET/LIMIT, so every row carries the full count.
+        # raiseload skips the recipient's selectin load; responses never read it.
+        result = self.db.execute(
+            select(Notification, func.count().over().label("total"))
+            .options(raiseload("*"))
+            .where(*conditions)
             .order_by(Notification.created_at.desc())
             .offset((page - 1) * page_size)
             .limit(page_size)
         )
+        rows = result.all()
 
-        result = self.db.execute(query)
-        notifications = result.scalars().all()
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there is no row to carry the count
+            total = self.db.execute(
+                select(func.count()).select_from(Notification).where(*conditions)
+            ).scalar() or 0
+        else:
+            total = 0
 
-        return [NotificationResponse.model_validate(n) for n in notifications], total
+        return [NotificationResponse.model_validate(row[0]) for row in rows], total
 
     def mark_as_read(
         self,
@@ -106,16 +122,22 @@ class NotificationService:
         user_id: UUID,
     ) -> int:
         """Mark notifications as read. Returns count of updated."""
+        if not notification_ids:
+            return 0
+
+        # id = ANY(:ids) with one array bind keeps the SQL text identical for
+        # any number of ids (IN would render one placeholder per id)
+        ids = bindparam("notification_ids", list(notification_ids), type_=ARRAY(BigInteger))
         result = self.db.execute(
             update(Notification)
             .where(
-                Notification.id.in_(notification_ids),
+                Notification.id == any_(ids),
                 Notification.user_id == user_id,
                 Notification.is_read == False,
             )
             .values(
                 is_read=True,
-                read_at=datetime.now(timezone.utc),
+                read_at=func.now(),
             )
         )
         self.db.flush()
@@ -136,7 +158,7 @@ class NotificationService:
             )
             .values(
                 is_read=True,
-                read_at=datetime.now(timezone.utc),
+                read_at=func.now(),
             )
         )
         self.db.flush()
@@ -151,7 +173,7 @@ class NotificationService:
         result = self.db.execute(
             select(
                 func.count().label("total"),
-                func.sum(func.cast(Notification.is_read == False, Integer)).label("unread"),
+                func.count().filter(Notification.is_read == False).label("unread"),
             )
             .where(
                 Notification.project_id == project_id,
@@ -175,9 +197,18 @@ class NotificationService:
         user_id: UUID,
     ) -> None:
         """Delete a notification."""
-        notification = self.get_notification(notification_id, user_id)
-        self.db.delete(notification)
-        self.db.flush()
+        # One DELETE ... RETURNING both removes the row and tells us whether
+        # it existed (and belonged to the user); nothing is loaded first
+        deleted_id = self.db.execute(
+            delete(Notification)
+            .where(
+                Notification.id == notification_id,
+                Notification.user_id == user_id,
+            )
+            .returning(Notification.id)
+        ).scalar_one_or_none()
+        if deleted_id is None:
+            raise NotFoundError("Notification", str(notification_id))
 
 
 # Convenience functions for creating common notifications
@@ -191,14 +222,14 @@ def notify_upload_failed(
 ) -> None:
     """Send notification for failed upload."""
     service = NotificationService(db)
-    service.create_notification(
+    service.create_notifications_bulk(
         project_id=project_id,
-        request=NotificationCreate(
+        requests=[NotificationCreate(
             user_id=user_id,
             title="Upload Failed",
             message=f"Your {upload_type} upload '{file_name}' failed with {error_count} errors.",
             notification_type="upload_failed",
-        ),
+        )],
     )
 
 
@@ -211,14 +242,14 @@ def notify_task_assigned(
 ) -> None:
     """Send notification for task assignment."""
     service = NotificationService(db)
-    service.create_notification(
+    service.create_notifications_bulk(
         project_id=project_id,
-        request=NotificationCreate(
+        requests=[NotificationCreate(
             user_id=user_id,
             title="New Task Assigned",
             message=f"You have been assigned a new task: '{task_title}' by {assigned_by}.",
             notification_type="task_assigned",
-        ),
+        )],
     )
 
 
@@ -231,16 +262,12 @@ def notify_permission_changed(
 ) -> None:
     """Send notification for permission change."""
     service = NotificationService(db)
-    service.create_notification(
+    service.create_notifications_bulk(
         project_id=project_id,
-        request=NotificationCreate(
+        requests=[NotificationCreate(
             user_id=user_id,
             title="Permissions Updated",
             message=f"Your role '{role_name}' has been {action}.",
             notification_type="permission_changed",
-        ),
+        )],
     )
-
-
-# Import for type hint
-from sqlalchemy import Integer
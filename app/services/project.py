@@ -1,8 +1,8 @@
 """Project management service."""
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, literal, select, tuple_, update
 from sqlalchemy.orm import Session
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.core.exceptions import NotFoundError, PermissionDeniedError, ValidationError
 from app.models.menu_screen import MenuScreen, ProjectMenuScreen
@@ -64,68 +64,54 @@ class ProjectService:
         self.db.add(project)
         self.db.flush()
 
-        # Allocate all menus to the new project by default
-        menu_result = self.db.execute(select(MenuScreen.id))
-        for (menu_id,) in menu_result:
-            project_menu = ProjectMenuScreen(
-                project_id=project.id,
-                menu_screen_id=menu_id,
+        # Allocate all menus to the new project by default, as one
+        # INSERT ... SELECT so no menu ids round-trip through Python
+        self.db.execute(
+            insert(ProjectMenuScreen).from_select(
+                ["project_id", "menu_screen_id"],
+                select(literal(project.id), MenuScreen.id),
             )
-            self.db.add(project_menu)
-        self.db.flush()
+        )
 
         admin_role_id = None
 
         # Create default roles if requested
         if request.add_default_roles:
-            # Get all permissions from the database
-            perm_result = self.db.execute(select(Permission))
-            all_permissions = {p.permission_key: p.id for p in perm_result.scalars().all()}
-
-            # Create School Admin role
-            school_admin_role = Role(
-                project_id=project.id,
-                name="School Admin",
-                description="School administrator with full access to manage the school",
-                is_project_admin=True,
-                is_role_admin=True,
-            )
-            self.db.add(school_admin_role)
-            self.db.flush()
-            admin_role_id = school_admin_role.id
+            # Create the School Admin and Staff roles in one INSERT ... RETURNING;
+            # ids come back in parameter order
+            admin_role_id, staff_role_id = self.db.execute(
+                insert(Role).returning(Role.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "project_id": project.id,
+                        "name": "School Admin",
+                        "description": "School administrator with full access to manage the school",
+                        "is_project_admin": True,
+                        "is_role_admin": True,
+                    },
+                    {
+                        "project_id": project.id,
+                        "name": "Staff",
+                        "description": "Staff member with limited access",
+                        "is_project_admin": False,
+                        "is_role_admin": False,
+                    },
+                ],
+            ).scalars().all()
 
             # Assign all permissions to School Admin except excluded ones
-            for perm_key, perm_id in all_permissions.items():
-                if perm_key not in SCHOOL_ADMIN_EXCLUDED_PERMISSIONS:
-                    role_perm = RolePermission(
-                        project_id=project.id,
-                        role_id=school_admin_role.id,
-                        permission_id=perm_id,
-                    )
-                    self.db.add(role_perm)
-
-            # Create Staff role
-            staff_role = Role(
-                project_id=project.id,
-                name="Staff",
-                description="Staff member with limited access",
-                is_project_admin=False,
-                is_role_admin=False,
+            self._grant_permissions(
+                project.id,
+                admin_role_id,
+                Permission.permission_key.notin_(SCHOOL_ADMIN_EXCLUDED_PERMISSIONS),
             )
-            self.db.add(staff_role)
-            self.db.flush()
 
             # Assign limited permissions to Staff role
-            for perm_key in STAFF_DEFAULT_PERMISSIONS:
-                if perm_key in all_permissions:
-                    role_perm = RolePermission(
-                        project_id=project.id,
-                        role_id=staff_role.id,
-                        permission_id=all_permissions[perm_key],
-                    )
-                    self.db.add(role_perm)
-
-            self.db.flush()
+            self._grant_permissions(
+                project.id,
+                staff_role_id,
+                Permission.permission_key.in_(STAFF_DEFAULT_PERMISSIONS),
+            )
 
         # Assign creator as School Admin if default roles were created
         if admin_role_id:
@@ -137,10 +123,24 @@ class ProjectService:
             self.db.add(user_role)
             self.db.flush()
 
-        self.db.refresh(project)
-
+        # Every response column was set client-side (defaults included) or
+        # returned by the flush's INSERT, so no refresh SELECT is needed
         return ProjectResponse.model_validate(project)
 
+    def _grant_permissions(self, project_id: int, role_id: int, permission_filter) -> None:
+        """Grant a role every permission matching permission_filter.
+
+        Runs as one INSERT ... SELECT from permissions; unknown keys simply
+        match nothing.
+        """
+        self.db.execute(
+            insert(RolePermission).from_select(
+                ["project_id", "role_id", "permission_id"],
+                select(literal(project_id), literal(role_id), Permission.id)
+                .where(permission_filter),
+            )
+        )
+
     def get_project(self, project_id: int) -> Project:
         """Get project by ID."""
         result = self.db.execute(
@@ -165,20 +165,39 @@ class ProjectService:
         for field, value in update_data.items():
             setattr(project, field, value)
 
+        # updated_at is set client-side by onupdate; the instance is current
         self.db.flush()
-        self.db.refresh(project)
 
         return ProjectResponse.model_validate(project)
 
-    def list_all_projects(self) -> list[ProjectResponse]:
+    def list_all_projects(
+        self,
+        after_name: str | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[ProjectResponse]:
         """List all projects (for super admin use).
         
-        Returns all projects in the system without deduplication issues.
+        Returns all projects in the system without deduplication issues,
+        ordered by (name, id). Without a limit every project is returned.
+        To page by keyset, pass a limit and the last project's name and id
+        (both or neither) to get the next page.
         """
-        result = self.db.execute(
-            select(Project).order_by(Project.name)
-        )
-        projects = result.scalars().all()
+        if (after_name is None) != (after_id is None):
+            raise ValidationError(
+                "after_name and after_id must be given together",
+                details={"after_name": after_name, "after_id": after_id},
+            )
+
+        # Relationships are never read for the response; raiseload skips the
+        # selectin loads of roles/menu allocations and flags any accidental access
+        query = select(Project).options(raiseload("*"))
+        if after_name is not None:
+            query = query.where(tuple_(Project.name, Project.id) > (after_name, after_id))
+        query = query.order_by(Project.name, Project.id)
+        if limit is not None:
+            query = query.limit(limit)
+        projects = self.db.execute(query).scalars().all()
         return [ProjectResponse.model_validate(p) for p in projects]
 
     def list_user_projects(self, user_id: int) -> list[ProjectListItem]:
@@ -187,49 +206,50 @@ class ProjectService:
         Returns all roles the user has across all projects.
         A user with multiple roles in the same project will have multiple entries.
         """
+        # Only the columns ProjectListItem needs; full Project/Role entities
+        # would also fire their selectin relationship loads for every row
         result = self.db.execute(
-            select(Project, Role)
+            select(
+                Project.id,
+                Project.name,
+                Project.slug,
+                Project.description,
+                Project.theme_color,
+                Project.logo_url,
+                Project.status,
+                Role.id.label("role_id"),
+                Role.name.label("role_name"),
+                Role.is_project_admin,
+                Role.is_role_admin,
+            )
             .join(UserRoleProject, Project.id == UserRoleProject.project_id)
             .join(Role, UserRoleProject.role_id == Role.id)
             .where(UserRoleProject.user_id == user_id)
             .order_by(Project.name, Role.name)
         )
-        rows = result.all()
 
         # Return all project-role combinations (no deduplication)
         # This allows the frontend to show all roles a user can switch between
-        project_roles: list[ProjectListItem] = []
-        for project, role in rows:
-            project_roles.append(ProjectListItem(
-                id=project.id,
-                name=project.name,
-                slug=project.slug,
-                description=project.description,
-                theme_color=project.theme_color,
-                logo_url=project.logo_url,
-                status=project.status,
-                role_id=role.id,
-                role_name=role.name,
-                is_project_admin=role.is_project_admin,
-                is_role_admin=role.is_role_admin,
-            ))
-
-        return project_roles
+        return [ProjectListItem(**row) for row in result.mappings()]
 
     def suspend_project(self, project_id: int) -> ProjectResponse:
         """Suspend a project (block all mutations)."""
-        project = self.get_project(project_id)
-        project.status = ProjectStatus.SUSPENDED
-        self.db.flush()
-        self.db.refresh(project)
-        return ProjectResponse.model_validate(project)
+        return self._set_status(project_id, ProjectStatus.SUSPENDED)
 
     def activate_project(self, project_id: int) -> ProjectResponse:
         """Activate a suspended project."""
-        project = self.get_project(project_id)
-        project.status = ProjectStatus.ACTIVE
-        self.db.flush()
-        self.db.refresh(project)
+        return self._set_status(project_id, ProjectStatus.ACTIVE)
+
+    def _set_status(self, project_id: int, status: ProjectStatus) -> ProjectResponse:
+        """Flip a project's status with a single UPDATE ... RETURNING."""
+        project = self.db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(status=status)
+            .returning(Project)
+        ).scalar_one_or_none()
+        if not project:
+            raise NotFoundError("Project", str(project_id))
         return ProjectResponse.model_validate(project)
 
     def delete_project(self, project_id: int) -> None:
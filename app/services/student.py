@@ -1,13 +1,14 @@
 """Student management service."""
 
 from io import BytesIO
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
 from openpyxl import Workbook, load_workbook
 from sqlalchemy import func, select, or_
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import NotFoundError, ValidationError
+from app.models.attendance import AttendanceRecord
 from app.models.student import Student
 from app.schemas.student import (
     StudentCreate,
@@ -17,6 +18,7 @@ from app.schemas.student import (
     StudentFilter,
     PaginatedStudentResponse,
 )
+from app.services.attendance import refresh_daily_summary
 
 
 # Excel template columns for student upload
@@ -76,17 +78,34 @@ class StudentService:
         """Update a student."""
         student = self.get_student(project_id, student_id)
         update_data = request.model_dump(exclude_unset=True)
+        class_changed = any(
+            field in update_data and update_data[field] != getattr(student, field)
+            for field in ("class_name", "section")
+        )
         for field, value in update_data.items():
             setattr(student, field, value)
         self.db.flush()
+        # Per-class attendance summaries count this student under the old class
+        if class_changed:
+            refresh_daily_summary(self.db, project_id, self._attendance_dates(student_id))
         self.db.refresh(student)
         return StudentResponse.model_validate(student)
 
     def delete_student(self, project_id: int, student_id: int) -> None:
         """Delete a student."""
         student = self.get_student(project_id, student_id)
+        attendance_dates = self._attendance_dates(student_id)
         self.db.delete(student)
         self.db.flush()
+        refresh_daily_summary(self.db, project_id, attendance_dates)
+
+    def _attendance_dates(self, student_id: int) -> list[date]:
+        """Dates on which the student has attendance records."""
+        return list(self.db.execute(
+            select(AttendanceRecord.attendance_date)
+            .where(AttendanceRecord.student_id == student_id)
+            .distinct()
+        ).scalars())
 
     def list_students(
         self,
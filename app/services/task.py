@@ -627,11 +627,13 @@ class TaskService:
                     balance_after=new_balance,
                     reason=f"Task reverted: {task.title}",
                     task_id=task.id,
-                    metadata={
+                    extra_data={
                         "task_title": task.title,
                         "original_reward_transaction_id": earned_transaction.id,
                         "reverted_points": earned_transaction.amount,
                     },
+                    user_name_snapshot=user.name,
+                    task_title_snapshot=task.title,
                 )
                 self.db.add(reversal)
 
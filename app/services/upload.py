@@ -16,6 +16,7 @@ from app.models.attendance import AttendanceRecord, AttendanceStatus
 from app.models.exam import ExamRecord
 from app.models.upload import Upload, UploadError as UploadErrorModel, UploadStatus, UploadType
 from app.schemas.upload import UploadErrorResponse, UploadResult
+from app.services.attendance import refresh_daily_summary
 
 # Setup debug logger
 logger = logging.getLogger(__name__)
@@ -63,12 +64,14 @@ class UploadService:
 
             errors: list[UploadErrorModel] = []
             successful = 0
+            attendance_dates = set()
 
             for row_num, row in enumerate(rows, start=2):  # Start at 2 (header is 1)
                 logger.debug(f"[ATTENDANCE UPLOAD] Processing row {row_num}: {row}")
                 try:
                     record = self._validate_attendance_row(row, row_num, project_id, upload.id)
                     self.db.add(record)
+                    attendance_dates.add(record.attendance_date)
                     successful += 1
                     logger.debug(f"[ATTENDANCE UPLOAD] Row {row_num} SUCCESS - Created record: student_id={record.student_id}, student_name={record.student_name}, date={record.attendance_date}, status={record.status}")
                 except ValidationError as e:
@@ -97,6 +100,7 @@ class UploadService:
             
             self.db.flush()
             logger.debug(f"[ATTENDANCE UPLOAD] Database flush completed - records should be persisted")
+            refresh_daily_summary(self.db, project_id, attendance_dates)
 
             return UploadResult(
                 upload_id=upload.id,